@@ -1,4 +1,4 @@
-from typing import Callable, TypeVar, Union
+from typing import Callable, Iterator, TypeVar, Union
 from cucm.axl.validation import (
     validate_ucm_server,
     validate_axl_auth,
@@ -9,35 +9,114 @@ from cucm.axl.wsdl import (
     AXLElement,
     get_return_tags,
     fix_return_tags,
+    fix_all_return_tags,
     get_tree,
+    get_type_factory,
     print_element_layout,
     print_required_element_layout,
     print_return_tags_layout,
     validate_arguments,
 )
 from cucm.utils import print_signature, Empty
+from cucm.axl.cache import get_shared_cache, get_wsdl_document, freeze, ResultCache
 import cucm.axl.configs as cfg
 import re
+import threading
 import urllib3
 from requests import Session
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from zeep import Client, Settings
 from zeep.transports import Transport
-from zeep.cache import SqliteCache
-from zeep.exceptions import Fault
+from zeep.exceptions import Fault, TransportError
 from zeep.helpers import serialize_object
 from zeep.xsd import Nil
-from functools import wraps
+from zeep.xsd.valueobjects import CompoundValue
+from functools import wraps, lru_cache, cached_property
+from contextlib import contextmanager
+from operator import attrgetter, itemgetter
 from copy import deepcopy
+from collections import deque
 import inspect
 from termcolor import colored
-from time import sleep
+from time import sleep, monotonic
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+_UUID_PATTERN = re.compile(r"^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$", re.IGNORECASE)
+# characters allowed in a DN pattern (digits and route pattern wildcards)
+_DN_CHARS = frozenset("0123456789?!\\[]+-*^#X")
+
+# every Axl instance parses (and shares) the WSDL with these exact settings
+_ZEEP_SETTINGS = Settings(
+    strict=False, xml_huge_tree=True, xsd_ignore_sequence_order=True
+)
+
+# UCM versions whose addLocation takes kbits/videoKbits instead of between-location bandwidth
+_LEGACY_ADD_LOCATION = frozenset({"8.6", "9.0", "9.5", "10.0"})
+
+# settings add_route_list gives each of its route group members
+_ROUTE_LIST_MEMBER_DEFAULTS = {
+    "calledPartyTransformationMask": "",
+    "callingPartyTransformationMask": "",
+    "digitDiscardInstructionName": "",
+    "callingPartyPrefixDigits": "",
+    "prefixDigitsOut": "",
+    "useFullyQualifiedCallingPartyNumber": "Default",
+    "callingPartyNumberingPlan": "Cisco CallManager",
+    "callingPartyNumberType": "Cisco CallManager",
+    "calledPartyNumberingPlan": "Cisco CallManager",
+    "calledPartyNumberType": "Cisco CallManager",
+}
+
+# default return tags of get_phones
+_PHONE_LIST_TAGS = (
+    "name",
+    "product",
+    "description",
+    "protocol",
+    "locationName",
+    "callingSearchSpaceName",
+)
+
+# returnedTags of get_translation, and of get_translations along with the uuid
+_TRANS_PATTERN_TAGS = {
+    "pattern": "",
+    "description": "",
+    "routePartitionName": "",
+    "callingSearchSpaceName": "",
+    "useCallingPartyPhoneMask": "",
+    "patternUrgency": "",
+    "provideOutsideDialtone": "",
+    "prefixDigitsOut": "",
+    "calledPartyTransformationMask": "",
+    "callingPartyTransformationMask": "",
+    "digitDiscardInstructionName": "",
+    "callingPartyPrefixDigits": "",
+}
+_TRANS_PATTERN_LIST_TAGS = {"uuid": "", **_TRANS_PATTERN_TAGS}
+
+# returnedTags of list_route_plan and list_route_plan_specific
+_ROUTE_PLAN_TAGS = {"dnOrPattern": "", "partition": "", "type": "", "routeDetail": ""}
+
+# returnedTags of get_called_party_xforms and get_calling_party_xforms
+_XFORM_LIST_TAGS = {"pattern": "", "description": "", "uuid": ""}
+
+# returnedTags of the lookups that only need an object's name (and uuid)
+_NAME_TAGS = {"name": ""}
+
+# related region settings update_region gives every region other than itself
+_G711_RELATED_REGION = {
+    "bandwidth": "64 kbps",
+    "videoBandwidth": "-1",
+    "immersiveVideoBandwidth": "-1",
+    "lossyNetwork": "Use System Default",
+}
+
 ########################
 # ----- DECORATORS -----
 ########################
@@ -45,31 +124,51 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 TCallable = TypeVar("TCallable", bound=Callable)
 
 
+def _tag_keep_set(tags: Union[list, dict]) -> Union[frozenset, None]:
+    """Pre-computes which top-level tags `_serialize_filtered` keeps when their value is None. Do not use.
+
+    Parameters
+    ----------
+    tags : Union[list, dict]
+        The return tags used for the request
+
+    Returns
+    -------
+    Union[frozenset, None]
+        The tag names to keep, or None if nothing should be dropped (no tags given)
+    """
+    if not tags:
+        return None
+    # a complex tag list ([dict]) never matches a tag name, so every None is dropped
+    return frozenset(t for t in tags if isinstance(t, str))
+
+
 def serialize(func: TCallable) -> TCallable:
+    """Turns the zeep response of the decorated method into dicts, keeping only the requested return tags. Callers can pass raw=True to get the zeep objects instead."""
+    if cfg.DISABLE_SERIALIZER:  # already off, nothing to wrap
+        return func
+
+    # signature is fixed at decoration time, no need to inspect it on every call
+    tags_param = inspect.signature(func).parameters.get("return_tags", None)
+    if tags_param is not None:
+        default_keep = _tag_keep_set(tags_param.default)
+
     @wraps(func)
-    def wrapper(*args, **kwargs):
+    def wrapper(*args, raw=False, **kwargs):
         r_value = func(*args, **kwargs)
         if cfg.DISABLE_SERIALIZER:
             return r_value
 
-        if r_value is None:
-            return dict()
-        elif issubclass(type(r_value), Fault):
+        if isinstance(r_value, Fault):
             raise AXLFault(r_value)
-        elif (
-            "return_tags" not in kwargs
-            and (
-                tags_param := inspect.signature(func).parameters.get(
-                    "return_tags", None
-                )
-            )
-            is not None
-        ):
-            r_dict = serialize_object(r_value, dict)
-            return _tag_serialize_filter(tags_param.default, r_dict)
+        elif raw:  # caller wants the zeep objects as-is
+            return r_value
+        elif r_value is None:
+            return dict()
+        elif "return_tags" not in kwargs and tags_param is not None:
+            return _serialize_tags(r_value, default_keep)
         elif "return_tags" in kwargs:
-            r_dict = serialize_object(r_value, dict)
-            return _tag_serialize_filter(kwargs["return_tags"], r_dict)
+            return _serialize_tags(r_value, _tag_keep_set(kwargs["return_tags"]))
         else:
             return serialize_object(r_value, dict)
 
@@ -77,84 +176,81 @@ def serialize(func: TCallable) -> TCallable:
 
 
 def serialize_list(func: TCallable) -> TCallable:
+    """Same as @serialize, for methods that return a list of zeep objects."""
+    if cfg.DISABLE_SERIALIZER:
+        return func
+
+    tags_param = inspect.signature(func).parameters.get("return_tags", None)
+    if tags_param is not None:
+        default_keep = _tag_keep_set(tags_param.default)
+
     @wraps(func)
-    def wrapper(*args, **kwargs):
+    def wrapper(*args, raw=False, **kwargs):
         r_value = func(*args, **kwargs)
-        if cfg.DISABLE_SERIALIZER:
+        if cfg.DISABLE_SERIALIZER or raw:
             return r_value
 
-        if type(r_value) != list:
+        if not isinstance(r_value, list):
             return r_value
-        elif (
-            "return_tags" not in kwargs
-            and (
-                tags_param := inspect.signature(func).parameters.get(
-                    "return_tags", None
-                )
-            )
-            is not None
-        ):
-            return [
-                _tag_serialize_filter(
-                    tags_param.default, serialize_object(element, dict)
-                )
-                for element in r_value
-            ]
+        elif "return_tags" not in kwargs and tags_param is not None:
+            keep = default_keep
         elif "return_tags" in kwargs:
-            return [
-                _tag_serialize_filter(
-                    kwargs["return_tags"], serialize_object(element, dict)
-                )
-                for element in r_value
-            ]
+            keep = _tag_keep_set(kwargs["return_tags"])
+        else:
+            return None
+
+        # AXL list responses are all zeep objects, serialize them straight away
+        if all(isinstance(e, CompoundValue) for e in r_value):
+            return [_serialize_filtered(keep, e) for e in r_value]
+        return [_serialize_tags(e, keep) for e in r_value]
 
     return wrapper
 
 
 def check_tags(element_name: str):
     def check_tags_decorator(func: TCallable) -> TCallable:
+        if cfg.DISABLE_CHECK_TAGS:
+            func.element_name = element_name
+            func.check = "tags"
+            return func
+
+        tags_param = inspect.signature(func).parameters.get("return_tags", None)
+
+        # mistakes in the method definition can't change between calls, so work
+        # them out once here (but keep raising them when the method is called)
+        if tags_param is None:
+            misuse = f"No 'return_tags' param on {func.__name__}()"
+        elif tags_param.kind != tags_param.KEYWORD_ONLY:
+            misuse = f"Forgot to add '*' before return_tags on {func.__name__}()"
+        elif not element_name:
+            misuse = f"Forgot to provide element_name in check_tags decorator on {func.__name__}!!!"
+        else:
+            misuse = None
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if cfg.DISABLE_CHECK_TAGS:
                 return func(*args, **kwargs)
 
             # if type(args[0]) != Axl:
-            if not issubclass(type(args[0]), Axl):
+            if not isinstance(args[0], Axl):
                 raise DumbProgrammerException(
                     f"Forgot to include self in {func.__name__}!!!!"
                 )
-            elif (
-                tags_param := inspect.signature(func).parameters.get(
-                    "return_tags", None
-                )
-            ) is None:
-                raise DumbProgrammerException(
-                    f"No 'return_tags' param on {func.__name__}()"
-                )
-            elif tags_param.kind != tags_param.KEYWORD_ONLY:
-                raise DumbProgrammerException(
-                    f"Forgot to add '*' before return_tags on {func.__name__}()"
-                )
-            elif not element_name:
-                raise DumbProgrammerException(
-                    f"Forgot to provide element_name in check_tags decorator on {func.__name__}!!!"
-                )
+            elif misuse is not None:
+                raise DumbProgrammerException(misuse)
             elif "return_tags" not in kwargs:
                 # tags are default
                 if len(tags_param.default) == 0:
-                    kwargs["return_tags"] = fix_return_tags(
-                        z_client=args[0].zeep,
-                        element_name=element_name,
-                        tags=get_return_tags(args[0].zeep, element_name),
+                    kwargs["return_tags"] = fix_all_return_tags(
+                        args[0].zeep, element_name
                     )
                 return func(*args, **kwargs)
-            elif type(kwargs["return_tags"]) == list:
+            elif isinstance(kwargs["return_tags"], (list, tuple)):
                 # supply all legal tags if an empty list is provided
                 if len(kwargs["return_tags"]) == 0:
-                    kwargs["return_tags"] = fix_return_tags(
-                        z_client=args[0].zeep,
-                        element_name=element_name,
-                        tags=get_return_tags(args[0].zeep, element_name),
+                    kwargs["return_tags"] = fix_all_return_tags(
+                        args[0].zeep, element_name
                     )
                 else:
                     kwargs["return_tags"] = fix_return_tags(
@@ -171,6 +267,19 @@ def check_tags(element_name: str):
     return check_tags_decorator
 
 
+def soap_fault(func: TCallable) -> TCallable:
+    """Raises any zeep Fault from the decorated method as an AXLFault, so the method itself doesn't need the try/except."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Fault as e:
+            raise AXLFault(e)
+
+    return wrapper
+
+
 def operation_tag(element_name: str):
     def operation_tag_decorator(func: TCallable) -> TCallable:
         @wraps(func)
@@ -185,13 +294,19 @@ def operation_tag(element_name: str):
 
 def check_arguments(element_name: str, child=None):
     def check_argument_deorator(func: TCallable) -> TCallable:
+        if cfg.DISABLE_CHECK_ARGS:
+            func.element_name = element_name
+            func.check = "args"
+            return func
+
+        default_kwargs = frozenset(inspect.signature(func).parameters)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if cfg.DISABLE_CHECK_ARGS:
                 return func(*args, **kwargs)
 
             # get non-default kwargs
-            default_kwargs = list(inspect.signature(func).parameters)
             user_kwargs = {k: v for k, v in kwargs.items() if k not in default_kwargs}
             validate_arguments(args[0].zeep, element_name, child=child, **user_kwargs)
             return func(*args, **kwargs)
@@ -203,11 +318,89 @@ def check_arguments(element_name: str, child=None):
     return check_argument_deorator
 
 
+def cached(category: str, ttl: float = None):
+    """Reuses the result of a read-only method for `ttl` seconds (cfg.CACHE_TTL by default). Results are kept per Axl instance and handed out as copies, and any method decorated with @invalidates_cache(category) throws them away."""
+
+    def cached_decorator(func: TCallable) -> TCallable:
+        if cfg.DISABLE_CACHE:
+            return func
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if cfg.DISABLE_CACHE:
+                return func(self, *args, **kwargs)
+
+            try:
+                key = (func.__name__, freeze(args), freeze(kwargs))
+                result = self._cache.get(category, key, Empty)
+            except TypeError:  # arguments that can't be frozen, don't cache this call
+                return func(self, *args, **kwargs)
+
+            if result is Empty:
+                # a write that lands while func runs makes its result too old to keep
+                generation = self._cache.generation(category)
+                result = func(self, *args, **kwargs)
+                self._cache.put(
+                    category,
+                    key,
+                    deepcopy(result),
+                    ttl=cfg.CACHE_TTL if ttl is None else ttl,
+                    generation=generation,
+                )
+                return result
+            return deepcopy(result)
+
+        wrapper.cache_category = category
+        return wrapper
+
+    return cached_decorator
+
+
+def invalidates_cache(*categories: str):
+    """Clears the cached results of the given categories after the decorated method makes changes in UCM."""
+
+    def invalidates_cache_decorator(func: TCallable) -> TCallable:
+        if cfg.DISABLE_CACHE:
+            return func
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._cache.invalidate(*categories)
+
+        return wrapper
+
+    return invalidates_cache_decorator
+
+
 ###################
 # ----- CLASS -----
 ###################
 
 
+class _AxlBatch:
+    """Queue of Axl method calls made with Axl.batch(). Do not use directly."""
+
+    def __init__(self, ucm: "Axl", max_ops: int, verbose: bool) -> None:
+        self._ucm = ucm
+        self._max_ops = max_ops
+        self._verbose = verbose
+        self.calls: list[tuple[Callable, dict]] = []
+        self.results: list = []
+
+    def add(self, method: Callable, **kwargs) -> None:
+        self.calls.append((method, kwargs))
+        if self._max_ops and len(self.calls) >= self._max_ops:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.calls:
+            self.results.extend(self._ucm.bulk(self.calls, verbose=self._verbose))
+            self.calls = []
+
+
 class Axl(object):
     def __init__(
         self,
@@ -273,15 +466,28 @@ class Axl(object):
         session = Session()
         session.verify = False
         session.auth = HTTPBasicAuth(username, password)
-        settings = Settings(
-            strict=False, xml_huge_tree=True, xsd_ignore_sequence_order=True
+        # keep a warm pool of TLS connections big enough for _multithread's workers
+        retry_strat = Retry(connect=3, read=0, total=3, backoff_factor=0.2)
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=cfg.AXL_POOL_SIZE,
+                max_retries=retry_strat,
+            ),
         )
-        transport = Transport(session=session, timeout=10, cache=SqliteCache())
-        axl_client = Client(wsdl, settings=settings, transport=transport)
+        if verbose:
+            session.hooks["response"].append(_report_connection_close())
+        # the zeep client is only built (and the WSDL parsed) once self.zeep or
+        # self.client is first used, see below
+        self._session = session
+        self._verbose = verbose
+        self._zeep: Client = None
+        self._client = None
+        self._connect_lock = threading.RLock()
 
         self.username = username
         self.password = password
-        self.zeep = axl_client
         # self.schema = XMLSchema(str(wsdl_path.parent / "AXLSoap.xsd"))
         self.wsdl = wsdl
         self.cucm = cucm
@@ -297,18 +503,63 @@ class Axl(object):
         if not axl_validation:
             raise AXLException()
 
-        self.UUID_PATTERN = re.compile(
-            r"^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$", re.IGNORECASE
-        )
+        self.UUID_PATTERN = _UUID_PATTERN
+        self._cache = ResultCache()
+        self._legacy_add_location = cucm_version in _LEGACY_ADD_LOCATION
+
+    # cached_property doesn't lock (since Python 3.12), so the first use from
+    # several threads at once is guarded here to only ever build one of each
+
+    @cached_property
+    def zeep(self) -> Client:
+        """The zeep Client for this instance, built the first time it's needed"""
+        with self._connect_lock:
+            if self._zeep is None:
+                settings = _ZEEP_SETTINGS
+                transport = Transport(
+                    session=self._session, timeout=10, cache=get_shared_cache()
+                )
+                # the parsed WSDL is shared, only the transport is per-user
+                self._zeep = Client(
+                    get_wsdl_document(self.wsdl, settings),
+                    settings=settings,
+                    transport=transport,
+                )
+            return self._zeep
+
+    @cached_property
+    def client(self):
+        """The AXL service proxy for this instance, connected the first time it's needed"""
+        with self._connect_lock:
+            if self._client is None:
+                address = f"https://{self.cucm}:{self.cucm_port}/axl/"
+                if self._verbose:
+                    print(f"Connecting to AXL service at {address} ...")
+                client = self.zeep.create_service(
+                    "{http://www.cisco.com/AXLAPIService/}AXLAPIBinding", address
+                )
+                # bind every operation once so self.client.<op> is a plain attribute
+                # lookup instead of going through ServiceProxy.__getattr__ on each call
+                vars(client).update(dict(client))
+                if self._verbose:
+                    print("Connection to AXL service established!\n")
+                self._client = client
+            return self._client
 
-        if verbose:
-            print(f"Connecting to AXL service at https://{cucm}:{port}/axl/ ...")
-        self.client = axl_client.create_service(
-            "{http://www.cisco.com/AXLAPIService/}AXLAPIBinding",
-            f"https://{cucm}:{port}/axl/",
-        )
-        if verbose:
-            print("Connection to AXL service established!\n")
+    @cached_property
+    def _ops(self) -> dict:
+        """Every operation of the AXL service proxy by name. Do not use."""
+        return dict(self.client)
+
+    def close(self) -> None:
+        """Closes the pooled (keep-alive) connections to UCM. The instance can still be used afterwards, new connections are opened as needed."""
+        self._session.close()
+
+    def __enter__(self) -> "Axl":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     # *******************************
     # ----- [TEMPLATE FETCHING] -----
@@ -328,42 +579,45 @@ class Axl(object):
 
         def is_removable(branch: dict) -> bool:
             for value in branch.values():
-                if type(value) == dict:
+                if isinstance(value, dict):
                     if is_removable(value) == False:
                         return False
-                elif type(value) == list:
-                    if not all([type(v) == dict for v in value]):
-                        return False
-                    elif not all([is_removable(v) for v in value]):
+                elif isinstance(value, list):
+                    if not all(isinstance(v, dict) and is_removable(v) for v in value):
                         return False
                 elif value not in (None, -1, ""):
                     return False
             else:
                 return True
 
+        # the element tree is fixed for a given WSDL, so a node's answer never changes
+        chain_required: dict[int, bool] = {}
+
+        def is_required(node: AXLElement) -> bool:
+            if (required := chain_required.get(id(node), None)) is None:
+                required = chain_required[id(node)] = node._parent_chain_required()
+            return required
+
         def tree_match(root: AXLElement, template: dict) -> dict:
             result = {}
             for name, value in template.items():
                 if (node := root.get(name, None)) is not None:
                     if node.children:
-                        if type(value) == dict:
+                        if isinstance(value, dict):
                             result_dict = tree_match(node, value)
-                            if (
-                                not is_removable(result_dict)
-                                or node._parent_chain_required()
-                            ):
+                            if not is_removable(result_dict) or is_required(node):
                                 result[name] = result_dict
-                        elif type(value) == list:
+                        elif isinstance(value, list):
                             result_list = [tree_match(node, t) for t in value]
-                            if all([type(r) == dict for r in result_list]):
+                            if all(isinstance(r, dict) for r in result_list):
                                 result_list = [
                                     r for r in result_list if not is_removable(r)
                                 ]
                             if result_list:
                                 result[name] = result_list
-                    elif value is None and node._parent_chain_required():
+                    elif value is None and is_required(node):
                         result[name] = Nil
-                    elif value not in (None, -1, "") or node._parent_chain_required():
+                    elif value not in (None, -1, "") or is_required(node):
                         # else:
                         result[name] = value
             return result
@@ -377,14 +631,15 @@ class Axl(object):
                 )
 
         result_data = tree_match(tree, template)
-        for name, value in deepcopy(result_data).items():
-            if tree.get(name)._parent_chain_required():
+        # only top-level keys are popped, so a snapshot of the items is enough
+        for name, value in list(result_data.items()):
+            if is_required(tree.get(name)):
                 # continue
                 if value is None:
                     result_data[name] = Nil
             elif value in (None, -1, ""):
                 result_data.pop(name)
-            elif type(value) == dict and is_removable(value):
+            elif isinstance(value, dict) and is_removable(value):
                 result_data.pop(name)
 
         return result_data
@@ -523,18 +778,28 @@ class Axl(object):
         element_name: str,
         msg_kwargs: dict,
         wanted_keys: list[str],
+        exclude_key: str = None,
     ):
-        try:
-            result = getattr(self.client, element_name)(**msg_kwargs)
-        except AttributeError:
+        if exclude_key is not None and exclude_key in msg_kwargs:
+            msg_kwargs = dict(msg_kwargs)
+            del msg_kwargs[exclude_key]
+
+        if (operation := self._ops.get(element_name, None)) is None:
             raise DumbProgrammerException(f"AXL has no element named {element_name}")
+        try:
+            result = operation(**msg_kwargs)
         except Fault as e:
             raise AXLFault(e)
 
-        if type(result) == list:
+        if isinstance(result, list):
             # ignore wanted keys since it's not a mapping
             return result
 
+        try:
+            return _key_getter(tuple(wanted_keys))(result)
+        except (TypeError, KeyError):
+            pass  # walk it again below to find out where it went wrong
+
         for key in wanted_keys:
             try:
                 result = result[key]
@@ -565,40 +830,70 @@ class Axl(object):
             raise DumbProgrammerException(
                 f"({element_name}) 'uuid' not supplied as a kwarg"
             )
-        if uuid_value:
-            return self._base_soap_call(
-                element_name,
-                {k: v for k, v in msg_kwargs.items() if k != non_uuid_value},
-                wanted_keys,
-            )
-        else:
-            return self._base_soap_call(
-                element_name,
-                {k: v for k, v in msg_kwargs.items() if k != "uuid"},
-                wanted_keys,
-            )
+        return self._base_soap_call(
+            element_name,
+            msg_kwargs,
+            wanted_keys,
+            exclude_key=non_uuid_value if uuid_value else "uuid",
+        )
 
     # *************************
     # ----- [OTHER TOOLS] -----
     # *************************
 
+    def _typed(self, type_name: str, fields: dict):
+        """Builds an AXL object of the given XSD type (i.e. "XPhone") from a dict of its fields, so zeep doesn't have to resolve the dict against the schema on every request. Do not use.
+
+        Parameters
+        ----------
+        type_name : str
+            Name of the XSD type, without the namespace prefix
+        fields : dict
+            The object's values
+
+        Returns
+        -------
+        CompoundValue
+            The object, ready to pass to an AXL request
+        """
+        return get_type_factory(self.zeep, type_name)(**fields)
+
     def _multithread(
         self,
-        method: Callable,
-        kwargs_list: list[dict],
+        method: Union[Callable, None],
+        kwargs_list: list,
         catagorize_by=None,
         verbose=False,
+        max_workers=None,
     ):
+        # without a method, every item is its own (method, kwargs) pair
+        calls = kwargs_list if method is None else [(method, kw) for kw in kwargs_list]
+        if max_workers is None:
+            max_workers = cfg.AXL_PARALLEL
+
         if verbose:
-            print(f"Starting {method.__name__} multithreaded operation...")
-            pbar = tqdm(total=len(kwargs_list))
+            if method is not None:
+                print(f"Starting {method.__name__} multithreaded operation...")
+            # redraw in batches, not once per finished request
+            pbar = tqdm(
+                total=len(calls),
+                miniters=max(1, len(calls) // 200),
+                mininterval=0.2,
+                smoothing=0,
+            )
+
+        # results are slotted in submission order as they finish
+        results: list = [None] * len(calls)
 
-        with ThreadPoolExecutor(max_workers=100) as ex:
-            axl_futs = {ex.submit(method, **kw): kw for kw in kwargs_list}
+        # don't spin up more threads than there are requests to make
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls)))) as ex:
+            axl_futs = {ex.submit(func, **kw): i for i, (func, kw) in enumerate(calls)}
             for fut in as_completed(axl_futs):
                 if (exc := fut.exception()) is not None:
                     ex.shutdown(wait=False, cancel_futures=True)
-                    raise MultithreadException(method.__name__, axl_futs[fut], exc)
+                    func, kw = calls[axl_futs[fut]]
+                    raise MultithreadException(func.__name__, kw, exc)
+                results[axl_futs[fut]] = fut.result()
                 if verbose:
                     pbar.update(1)
 
@@ -606,9 +901,125 @@ class Axl(object):
             pbar.close()
 
         if catagorize_by is not None:
-            return {kw[catagorize_by]: f.result() for f, kw in axl_futs.items()}
+            return {kw[catagorize_by]: r for (_, kw), r in zip(calls, results)}
         else:
-            return [f.result() for f in axl_futs.keys()]
+            return results
+
+    def bulk(self, calls: list[tuple[Callable, dict]], verbose=False) -> list:
+        """Runs several (different) Axl methods at the same time instead of one after another, so their AXL requests overlap. At most cfg.AXL_PARALLEL (CUCM_PARALLEL) calls are in flight at once.
+
+        Parameters
+        ----------
+        calls : list[tuple[Callable, dict]]
+            (method, kwargs) pairs, i.e. [(ucm.get_locations, {}), (ucm.get_regions, {"name": "A%"})]
+        verbose : bool, optional
+            Show a progress bar, by default False
+
+        Returns
+        -------
+        list
+            The result of each call, in the same order as `calls`
+
+        Raises
+        ------
+        MultithreadException
+            if one of the calls raises an exception
+        """
+        return self._multithread(None, calls, verbose=verbose)
+
+    def get_many(
+        self, get_method: Callable, items: list[dict], max_workers=None, verbose=False
+    ) -> list:
+        """Runs the same read-only Axl method for many arguments at once, i.e. `ucm.get_many(ucm.get_route_list, [{"name": "RL-A"}, {"name": "RL-B"}])`. The AXL requests overlap over the session's connection pool instead of waiting on each other.
+
+        Any `get_*`/`list`-style method (get_route_list, get_partition, get_calling_search_space, get_directory_number, get_cti_route_point, ...) is safe to run this way. Writes to the same object should still be made one at a time.
+
+        Parameters
+        ----------
+        get_method : Callable
+            The Axl method to call for every item, like `ucm.get_route_list`
+        items : list[dict]
+            The kwargs for each call to `get_method`
+        max_workers : int, optional
+            Max number of requests in flight at once, by default cfg.AXL_PARALLEL (CUCM_PARALLEL)
+        verbose : bool, optional
+            Show a progress bar, by default False
+
+        Returns
+        -------
+        list
+            The result of each call, in the same order as `items`
+
+        Raises
+        ------
+        MultithreadException
+            if one of the calls raises an exception
+        """
+        if not items:
+            return []
+        return self._multithread(
+            get_method, items, verbose=verbose, max_workers=max_workers
+        )
+
+    def bulk_add(self, add_method: Callable, items: list[dict], verbose=False) -> list:
+        """Makes many objects of the same kind at once, i.e. `ucm.bulk_add(ucm.add_srst, [{"name": "A", "ip_address": "10.0.0.1"}, ...])`. AXL has no batched add operations, so the requests are sent concurrently over the session's connection pool instead of one after another. At most cfg.AXL_PARALLEL (CUCM_PARALLEL) adds are in flight at once.
+
+        Parameters
+        ----------
+        add_method : Callable
+            The Axl method to call for every item, like `ucm.add_srst`
+        items : list[dict]
+            The kwargs for each call to `add_method`
+        verbose : bool, optional
+            Show a progress bar, by default False
+
+        Returns
+        -------
+        list
+            The result of each add, in the same order as `items`
+
+        Raises
+        ------
+        MultithreadException
+            if one of the adds raises an exception. Adds that already finished are not undone.
+        """
+        if not items:
+            return []
+        return self._multithread(add_method, items, verbose=verbose)
+
+    @contextmanager
+    def batch(self, max_ops=50, verbose=False):
+        """Collects Axl method calls and sends them together (concurrently) when the `with` block ends, i.e.
+
+        ```
+        with ucm.batch() as b:
+            for name in names:
+                b.add(ucm.add_route_group, name=name, distribution_algorithm="Top Down")
+        uuids = b.results
+        ```
+
+        AXL only accepts one operation per request, so the calls are sent through `bulk()` instead of in a single envelope. Nothing is sent if the block raises an exception.
+
+        Parameters
+        ----------
+        max_ops : int, optional
+            Send the queued calls early once this many are waiting, by default 50. Use 0 to only send them at the end.
+        verbose : bool, optional
+            Show a progress bar for each group of calls sent, by default False
+
+        Yields
+        ------
+        _AxlBatch
+            Queue the calls with `.add(method, **kwargs)`. The results, in the order the calls were added, are available from `.results` afterwards.
+
+        Raises
+        ------
+        MultithreadException
+            if one of the calls raises an exception
+        """
+        queue = _AxlBatch(self, max_ops, verbose)
+        yield queue
+        queue.flush()
 
     def print_axl_arguments(
         self, method_name: str, show_required_only=False, show_member_types=False
@@ -692,27 +1103,46 @@ class Axl(object):
         result = {"num_rows": 0, "query": query}
 
         try:
-            sql_result = self.sql_query(query)
+            sql_rows = self._sql_query_rows(query)
         except Exception as fault:
-            sql_result = None
+            sql_rows = []
             self.last_exception = fault
 
-        num_rows = 0
-        result_rows = []
-
-        if sql_result is not None:
-            for row in sql_result["row"]:
-                result_rows.append({})
-                for column in row:
-                    result_rows[num_rows][column.tag] = column.text
-                num_rows += 1
+        # build the row dicts straight from the returned elements
+        result_rows = [{c.tag: c.text for c in row} for row in sql_rows]
 
-        result["num_rows"] = num_rows
-        if num_rows > 0:
+        result["num_rows"] = len(result_rows)
+        if result_rows:
             result["rows"] = result_rows
 
         return result
 
+    def _sql_query_rows(self, query: str) -> list:
+        """Runs an SQL query on the UCM DB and returns the raw row elements returned by Zeep.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to run
+
+        Returns
+        -------
+        list
+            lxml Elements, one per row (each child is a column). Empty if nothing was returned.
+
+        Raises
+        ------
+        AXLFault
+            The error returned from AXL, if one occured.
+        """
+        try:
+            recv = self.client.executeSQLQuery(query)["return"]
+            return recv["row"] or []
+        except Fault as e:
+            raise AXLFault(e)
+        except (KeyError, TypeError):  # no rows returned
+            return []
+
     def sql_query(self, query: str) -> Union[list[list[str]], Fault]:
         """Runs an SQL query on the UCM DB and returns the results.
 
@@ -728,22 +1158,15 @@ class Axl(object):
         Fault
             The error returned from AXL, if one occured.
         """
-        try:
-            recv = self.client.executeSQLQuery(query)["return"]
-            data = recv["row"]
-        except Fault as e:
-            raise AXLFault(e)
-        except (KeyError, TypeError):  # no rows returned
-            return [[]]
+        data = self._sql_query_rows(query)
         if not data:  # data is empty
             return [[]]
 
         # Zeep returns nested list of Element objs
         # Need to extract text from all Element objs
-        parsed_data: list[list[str]] = []
-        parsed_data.append([e.tag for e in data[0]])  # headers
-        for row in data:
-            parsed_data.append([e.text for e in row])
+        get_text = attrgetter("text")
+        parsed_data: list[list[str]] = [[e.tag for e in data[0]]]  # headers
+        parsed_data.extend([list(map(get_text, row)) for row in data])
 
         return parsed_data
 
@@ -883,16 +1306,12 @@ class Axl(object):
         None
             If neither name nor uuid are supplied as parameters (no action taken).
         """
-        if name != "" and uuid == "":
-            try:
-                return self.client.doDeviceReset(deviceName=name, isHardReset=True)
-            except Fault as e:
-                return e
-        elif uuid != "":
-            try:
-                return self.client.doDeviceReset(uuid=uuid, isHardReset=True)
-            except Fault as e:
-                return e
+        if (identifier := _name_or_uuid(name, uuid, name_key="deviceName")) is None:
+            return None
+        try:
+            return self.client.doDeviceReset(**identifier, isHardReset=True)
+        except Fault as e:
+            return e
 
     # ? can't risk testing this
     @operation_tag("resetSipTrunk")
@@ -903,23 +1322,21 @@ class Axl(object):
         :param uuid: device uuid
         :return: result dictionary
         """
-        if name != "" and uuid == "":
-            try:
-                return self.client.resetSipTrunk(name=name)
-            except Fault as e:
-                return e
-        elif name == "" and uuid != "":
-            try:
-                return self.client.resetSipTrunk(uuid=uuid)
-            except Fault as e:
-                return e
+        if (identifier := _name_or_uuid(name, uuid)) is None:
+            return None
+        try:
+            return self.client.resetSipTrunk(**identifier)
+        except Fault as e:
+            return e
 
     #######################
     # ===== LOCATIONS =====
     #######################
 
+    @cached("location")
     @serialize_list
     @check_tags(element_name="listLocation")
+    @soap_fault
     def get_locations(
         self,
         name="%",
@@ -947,18 +1364,13 @@ class Axl(object):
         Fault
             The error returned from AXL, if one occured.
         """
-        if return_tags and type(return_tags[0]) == dict:
-            tags = return_tags[0]
-        elif return_tags:
-            tags = {t: "" for t in return_tags}
+        tags = _tag_handler(return_tags)
 
-        try:
-            return self.client.listLocation({"name": name}, returnedTags=tags,)[
-                "return"
-            ]["location"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listLocation({"name": name}, returnedTags=tags)["return"][
+            "location"
+        ]
 
+    @cached("location")
     @serialize
     @operation_tag("getLocation")
     def get_location(self, name="", uuid="") -> Union[dict, Fault, None]:
@@ -980,20 +1392,15 @@ class Axl(object):
         None
             If neither name nor uuid are supplied as parameters (no action taken).
         """
-        if name != "" and uuid == "":
-            try:
-                return self.client.getLocation(name=name)
-            except Fault as e:
-                return e
-        elif uuid != "":
-            try:
-                return self.client.getLocation(uuid=uuid)
-            except Fault as e:
-                return e
-        else:
+        if (identifier := _name_or_uuid(name, uuid)) is None:
             return None
+        try:
+            return self.client.getLocation(**identifier)
+        except Fault as e:
+            return e
 
     # ! I'm definitely gonna need help with this one...
+    @invalidates_cache("location")
     def add_location(
         self,
         name: str,
@@ -1014,12 +1421,7 @@ class Axl(object):
         :param within_immersive_kbits: ucm 10
         :return: result dictionary
         """
-        if (
-            self.cucm_version == "8.6"
-            or self.cucm_version == "9.0"
-            or self.cucm_version == "9.5"
-            or self.cucm_version == "10.0"
-        ):
+        if self._legacy_add_location:
             try:
                 return self.client.addLocation(
                     {
@@ -1033,17 +1435,6 @@ class Axl(object):
                 return e
         else:
             try:
-                betweenLocations = []
-                betweenLocation = {}
-                RLocationBetween = {}
-                RLocationBetween["locationName"] = "Hub_None"
-                RLocationBetween["weight"] = 0
-                RLocationBetween["audioBandwidth"] = within_audio_bw
-                RLocationBetween["videoBandwidth"] = within_video_bw
-                RLocationBetween["immersiveBandwidth"] = within_immersive_kbits
-                betweenLocation["betweenLocation"] = RLocationBetween
-                betweenLocations.append(betweenLocation)
-
                 return self.client.addLocation(
                     {
                         "name": name,
@@ -1051,12 +1442,23 @@ class Axl(object):
                         "withinAudioBandwidth": within_audio_bw,
                         "withinVideoBandwidth": within_video_bw,
                         "withinImmersiveKbits": within_immersive_kbits,
-                        "betweenLocations": betweenLocations,
+                        "betweenLocations": [
+                            {
+                                "betweenLocation": {
+                                    "locationName": "Hub_None",
+                                    "weight": 0,
+                                    "audioBandwidth": within_audio_bw,
+                                    "videoBandwidth": within_video_bw,
+                                    "immersiveBandwidth": within_immersive_kbits,
+                                }
+                            }
+                        ],
                     }
                 )
             except Fault as e:
                 return e
 
+    @invalidates_cache("location", "device_pool")
     @operation_tag("removeLocation")
     def delete_location(self, name="", uuid=""):
         """Deletes the requested location.
@@ -1077,33 +1479,28 @@ class Axl(object):
         None
             If neither name nor uuid are supplied as parameters (no action taken).
         """
-        if name != "" and uuid == "":
-            try:
-                return self.client.removeLocation(name=name)
-            except Fault as e:
-                return e
-        elif uuid != "":
-            try:
-                return self.client.removeLocation(uuid=uuid)
-            except Fault as e:
-                return e
-        else:
+        if (identifier := _name_or_uuid(name, uuid)) is None:
             return None
+        try:
+            return self.client.removeLocation(**identifier)
+        except Fault as e:
+            return e
 
     # ! gonna need help with this one too
+    @invalidates_cache("location", "device_pool")
     @check_arguments("updateLocation")
+    @soap_fault
     def update_location(self, **kwargs):
-        try:
-            return self.client.updateLocation(**kwargs)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateLocation(**kwargs)
 
     #####################
     # ===== REGIONS =====
     #####################
 
+    @cached("region")
     @serialize_list
     @check_tags("listRegion")
+    @soap_fault
     def get_regions(self, *, return_tags=[]) -> Union[list[dict], Fault]:
         """Gets a list of all regions on the current cluster. Note that the data that AXL will respond with is limited. Please used get_region() for a specific region if you wish to see more details.
 
@@ -1120,15 +1517,14 @@ class Axl(object):
             the error returned by AXL upon a failed request
         """
         tags = _tag_handler(return_tags)
-        try:
-            return self.client.listRegion(
-                searchCriteria={"name": "%"}, returnedTags=tags
-            )["return"]["region"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listRegion(searchCriteria={"name": "%"}, returnedTags=tags)[
+            "return"
+        ]["region"]
 
+    @cached("region")
     @serialize
     @check_tags("getRegion")
+    @soap_fault
     def get_region(self, name: str, *, return_tags=["name", "relatedRegions"]):
         """
         Get region information
@@ -1139,22 +1535,27 @@ class Axl(object):
             return_tags
         )  # TODO: figure out why relatedRegion isn't expanded from @check_tags
         print(tags)
-        try:
-            return self.client.getRegion(name=name, returnedTags=tags)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getRegion(name=name, returnedTags=tags)
 
+    @invalidates_cache("region")
+    @soap_fault
     def add_region(self, name):
         """
         Add a region
         :param name: Name of the region to add
         :return: result dictionary
         """
-        try:
-            return self.client.addRegion({"name": name})
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addRegion({"name": name})
+
+    @cached("region", ttl=30)
+    def _region_names(self) -> list[str]:
+        """Names of every region in UCM, used to build the related region list in update_region"""
+        all_regions = self.client.listRegion({"name": "%"}, returnedTags=_NAME_TAGS)
+        # zeep already hands back the names as str, no need to convert them
+        return [i["name"] for i in all_regions["return"]["region"]]
 
+    @invalidates_cache("region", "device_pool")
+    @soap_fault
     def update_region(self, name="", newName="", moh_region=""):
         """
         Update region and assign region to all other regions
@@ -1163,58 +1564,23 @@ class Axl(object):
         :param moh_region:
         :return:
         """
-        # Get all Regions
-        all_regions = self.client.listRegion({"name": "%"}, returnedTags={"name": ""})
-        # Make list of region names
-        region_names = [str(i["name"]) for i in all_regions["return"]["region"]]
-        # Build list of dictionaries to add to region api call
-        region_list = []
-
-        for i in region_names:
-            # Highest codec within a region
-            if i == name:
-                region_list.append(
-                    {
-                        "regionName": i,
-                        "bandwidth": "256 kbps",
-                        "videoBandwidth": "-1",
-                        "immersiveVideoBandwidth": "-1",
-                        "lossyNetwork": "Use System Default",
-                    }
-                )
+        # Build list of dictionaries to add to region api call, all G.711 by default
+        # (which includes the music on hold region)
+        region_names = self._region_names()
+        region_list = [{"regionName": i, **_G711_RELATED_REGION} for i in region_names]
 
-            # Music on hold region name
-            elif i == moh_region:
-                region_list.append(
-                    {
-                        "regionName": i,
-                        "bandwidth": "64 kbps",
-                        "videoBandwidth": "-1",
-                        "immersiveVideoBandwidth": "-1",
-                        "lossyNetwork": "Use System Default",
-                    }
-                )
+        # Highest codec within a region (region names are unique)
+        if name in region_names:
+            region_list[region_names.index(name)]["bandwidth"] = "256 kbps"
 
-            # All else G.711
-            else:
-                region_list.append(
-                    {
-                        "regionName": i,
-                        "bandwidth": "64 kbps",
-                        "videoBandwidth": "-1",
-                        "immersiveVideoBandwidth": "-1",
-                        "lossyNetwork": "Use System Default",
-                    }
-                )
-        try:
-            return self.client.updateRegion(
-                name=name,
-                newName=newName,
-                relatedRegions={"relatedRegion": region_list},
-            )
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateRegion(
+            name=name,
+            newName=newName,
+            relatedRegions={"relatedRegion": region_list},
+        )
 
+    @invalidates_cache("region", "device_pool")
+    @soap_fault
     def delete_region(self, **args):
         """
         Delete a location
@@ -1222,39 +1588,36 @@ class Axl(object):
         :param uuid: The uuid of the region to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeRegion(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeRegion(**args)
 
     ##################
     # ===== SRST =====
     ##################
 
+    @cached("srst")
+    @soap_fault
     def get_srsts(self, tagfilter={"uuid": ""}):
         """
         Get all SRST details
         :param mini: return a list of tuples of SRST details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listSrst({"name": "%"}, returnedTags=tagfilter)[
-                "return"
-            ]["srst"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listSrst({"name": "%"}, returnedTags=tagfilter)["return"][
+            "srst"
+        ]
 
+    @cached("srst")
+    @soap_fault
     def get_srst(self, name):
         """
         Get SRST information
         :param name: SRST name
         :return: result dictionary
         """
-        try:
-            return self.client.getSrst(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getSrst(name=name)
 
+    @invalidates_cache("srst")
+    @soap_fault
     def add_srst(self, name, ip_address, port=2000, sip_port=5060):
         """
         Add SRST
@@ -1264,29 +1627,27 @@ class Axl(object):
         :param sip_port: SIP port
         :return: result dictionary
         """
-        try:
-            return self.client.addSrst(
-                {
-                    "name": name,
-                    "port": port,
-                    "ipAddress": ip_address,
-                    "SipPort": sip_port,
-                }
-            )
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addSrst(
+            {
+                "name": name,
+                "port": port,
+                "ipAddress": ip_address,
+                "SipPort": sip_port,
+            }
+        )
 
+    @invalidates_cache("srst", "device_pool")
+    @soap_fault
     def delete_srst(self, name):
         """
         Delete a SRST
         :param name: The name of the SRST to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeSrst(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeSrst(name=name)
 
+    @invalidates_cache("srst", "device_pool")
+    @soap_fault
     def update_srst(self, name, newName=""):
         """
         Update a SRST
@@ -1294,15 +1655,14 @@ class Axl(object):
         :param newName: The new name of the SRST
         :return: result dictionary
         """
-        try:
-            return self.client.updateSrst(name=name, newName=newName)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateSrst(name=name, newName=newName)
 
     ##########################
     # ===== DEVICE POOLS =====
     ##########################
 
+    @cached("device_pool")
+    @soap_fault
     def get_device_pools(
         self,
         tagfilter={
@@ -1320,24 +1680,22 @@ class Axl(object):
         :param mini: return a list of tuples of device pool info
         :return: a list of dictionary's of device pools information
         """
-        try:
-            return self.client.listDevicePool({"name": "%"}, returnedTags=tagfilter,)[
-                "return"
-            ]["devicePool"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listDevicePool({"name": "%"}, returnedTags=tagfilter)[
+            "return"
+        ]["devicePool"]
 
+    @cached("device_pool")
+    @soap_fault
     def get_device_pool(self, **args):
         """
         Get device pool parameters
         :param name: device pool name
         :return: result dictionary
         """
-        try:
-            return self.client.getDevicePool(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getDevicePool(**args)
 
+    @invalidates_cache("device_pool")
+    @soap_fault
     def add_device_pool(
         self,
         name,
@@ -1364,26 +1722,25 @@ class Axl(object):
         :param network_locale: Network locale name
         :return: result dictionary
         """
-        try:
-            return self.client.addDevicePool(
-                {
-                    "name": name,
-                    "dateTimeSettingName": date_time_group,  # update to state timezone
-                    "regionName": region,
-                    "locationName": location,
-                    "localRouteGroup": {
-                        "name": "Standard Local Route Group",
-                        "value": route_group,
-                    },
-                    "mediaResourceListName": media_resource_group_list,
-                    "srstName": srst,
-                    "callManagerGroupName": cm_group,
-                    "networkLocale": network_locale,
-                }
-            )
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addDevicePool(
+            {
+                "name": name,
+                "dateTimeSettingName": date_time_group,  # update to state timezone
+                "regionName": region,
+                "locationName": location,
+                "localRouteGroup": {
+                    "name": "Standard Local Route Group",
+                    "value": route_group,
+                },
+                "mediaResourceListName": media_resource_group_list,
+                "srstName": srst,
+                "callManagerGroupName": cm_group,
+                "networkLocale": network_locale,
+            }
+        )
 
+    @invalidates_cache("device_pool")
+    @soap_fault
     def update_device_pool(self, **args):
         """
         Update a device pools route group and media resource group list
@@ -1402,26 +1759,24 @@ class Axl(object):
         :param media_resource_group_list:
         :return:
         """
-        try:
-            return self.client.updateDevicePool(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateDevicePool(**args)
 
+    @invalidates_cache("device_pool")
+    @soap_fault
     def delete_device_pool(self, **args):
         """
         Delete a Device pool
         :param device_pool: The name of the Device pool to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeDevicePool(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeDevicePool(**args)
 
     ################################
     # ===== CONFERENCE BRIDGES =====
     ################################
 
+    @cached("conference_bridge")
+    @soap_fault
     def get_conference_bridges(
         self,
         tagfilter={
@@ -1436,25 +1791,22 @@ class Axl(object):
         :param mini: List of tuples of conference bridge details
         :return: results dictionary
         """
-        try:
-            return self.client.listConferenceBridge(
-                {"name": "%"},
-                returnedTags=tagfilter,
-            )["return"]["conferenceBridge"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listConferenceBridge({"name": "%"}, returnedTags=tagfilter)[
+            "return"
+        ]["conferenceBridge"]
 
+    @cached("conference_bridge")
+    @soap_fault
     def get_conference_bridge(self, name):
         """
         Get conference bridge parameters
         :param name: conference bridge name
         :return: result dictionary
         """
-        try:
-            return self.client.getConferenceBridge(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getConferenceBridge(name=name)
 
+    @invalidates_cache("conference_bridge")
+    @soap_fault
     def add_conference_bridge(
         self,
         name,
@@ -1468,26 +1820,25 @@ class Axl(object):
         Add a conference bridge
         :param conference_bridge: Conference bridge name
         :param description: Conference bridge description
-        :param device_pool: Device pool name
-        :param location: Location name
-        :param product: Conference bridge type
-        :param security_profile: Conference bridge security type
-        :return: result dictionary
-        """
-        try:
-            return self.client.addConferenceBridge(
-                {
-                    "name": name,
-                    "description": description,
-                    "devicePoolName": device_pool,
-                    "locationName": location,
-                    "product": product,
-                    "securityProfileName": security_profile,
-                }
-            )
-        except Fault as e:
-            raise AXLFault(e)
+        :param device_pool: Device pool name
+        :param location: Location name
+        :param product: Conference bridge type
+        :param security_profile: Conference bridge security type
+        :return: result dictionary
+        """
+        return self.client.addConferenceBridge(
+            {
+                "name": name,
+                "description": description,
+                "devicePoolName": device_pool,
+                "locationName": location,
+                "product": product,
+                "securityProfileName": security_profile,
+            }
+        )
 
+    @invalidates_cache("conference_bridge")
+    @soap_fault
     def update_conference_bridge(self, **args):
         """
         Update a conference bridge
@@ -1500,26 +1851,24 @@ class Axl(object):
         :param security_profile: Conference bridge security type
         :return: result dictionary
         """
-        try:
-            return self.client.updateConferenceBridge(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateConferenceBridge(**args)
 
+    @invalidates_cache("conference_bridge")
+    @soap_fault
     def delete_conference_bridge(self, name):
         """
         Delete a Conference bridge
         :param name: The name of the Conference bridge to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeConferenceBridge(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeConferenceBridge(name=name)
 
     #########################
     # ===== TRANSCODERS =====
     #########################
 
+    @cached("transcoder")
+    @soap_fault
     def get_transcoders(
         self, tagfilter={"name": "", "description": "", "devicePoolName": ""}
     ):
@@ -1528,24 +1877,22 @@ class Axl(object):
         :param mini: List of tuples of transcoder details
         :return: results dictionary
         """
-        try:
-            return self.client.listTranscoder({"name": "%"}, returnedTags=tagfilter,)[
-                "return"
-            ]["transcoder"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listTranscoder({"name": "%"}, returnedTags=tagfilter)[
+            "return"
+        ]["transcoder"]
 
+    @cached("transcoder")
+    @soap_fault
     def get_transcoder(self, name):
         """
         Get conference bridge parameters
         :param name: transcoder name
         :return: result dictionary
         """
-        try:
-            return self.client.getTranscoder(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getTranscoder(name=name)
 
+    @invalidates_cache("transcoder")
+    @soap_fault
     def add_transcoder(
         self,
         name,
@@ -1561,18 +1908,17 @@ class Axl(object):
         :param product: Trancoder product
         :return: result dictionary
         """
-        try:
-            return self.client.addTranscoder(
-                {
-                    "name": name,
-                    "description": description,
-                    "devicePoolName": device_pool,
-                    "product": product,
-                }
-            )
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addTranscoder(
+            {
+                "name": name,
+                "description": description,
+                "devicePoolName": device_pool,
+                "product": product,
+            }
+        )
 
+    @invalidates_cache("transcoder")
+    @soap_fault
     def update_transcoder(self, **args):
         """
         Add a transcoder
@@ -1583,50 +1929,46 @@ class Axl(object):
         :param product: Trancoder product
         :return: result dictionary
         """
-        try:
-            return self.client.updateTranscoder(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateTranscoder(**args)
 
+    @invalidates_cache("transcoder")
+    @soap_fault
     def delete_transcoder(self, name):
         """
         Delete a Transcoder
         :param name: The name of the Transcoder to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeTranscoder(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeTranscoder(name=name)
 
     #################
     # ===== MTP =====
     #################
 
+    @cached("mtp")
+    @soap_fault
     def get_mtps(self, tagfilter={"name": "", "description": "", "devicePoolName": ""}):
         """
         Get mtps
         :param mini: List of tuples of transcoder details
         :return: results dictionary
         """
-        try:
-            return self.client.listMtp({"name": "%"}, returnedTags=tagfilter,)[
-                "return"
-            ]["mtp"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listMtp({"name": "%"}, returnedTags=tagfilter)["return"][
+            "mtp"
+        ]
 
+    @cached("mtp")
+    @soap_fault
     def get_mtp(self, name):
         """
         Get mtp parameters
         :param name: transcoder name
         :return: result dictionary
         """
-        try:
-            return self.client.getMtp(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getMtp(name=name)
 
+    @invalidates_cache("mtp")
+    @soap_fault
     def add_mtp(
         self,
         name,
@@ -1642,18 +1984,17 @@ class Axl(object):
         :param mtpType: MTP Type
         :return: result dictionary
         """
-        try:
-            return self.client.addMtp(
-                {
-                    "name": name,
-                    "description": description,
-                    "devicePoolName": device_pool,
-                    "mtpType": mtpType,
-                }
-            )
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addMtp(
+            {
+                "name": name,
+                "description": description,
+                "devicePoolName": device_pool,
+                "mtpType": mtpType,
+            }
+        )
 
+    @invalidates_cache("mtp")
+    @soap_fault
     def update_mtp(self, **args):
         """
         Update an MTP
@@ -1664,26 +2005,24 @@ class Axl(object):
         :param mtpType: MTP Type
         :return: result dictionary
         """
-        try:
-            return self.client.updateMtp(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateMtp(**args)
 
+    @invalidates_cache("mtp")
+    @soap_fault
     def delete_mtp(self, name):
         """
         Delete an MTP
         :param name: The name of the Transcoder to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeMtp(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeMtp(name=name)
 
     ###########################
     # ===== H323 GATEWAYS =====
     ###########################
 
+    @cached("h323_gateway")
+    @soap_fault
     def get_h323_gateways(
         self,
         tagfilter={
@@ -1699,24 +2038,22 @@ class Axl(object):
         :param mini: List of tuples of H323 Gateway details
         :return: results dictionary
         """
-        try:
-            return self.client.listH323Gateway({"name": "%"}, returnedTags=tagfilter,)[
-                "return"
-            ]["h323Gateway"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listH323Gateway({"name": "%"}, returnedTags=tagfilter)[
+            "return"
+        ]["h323Gateway"]
 
+    @cached("h323_gateway")
+    @soap_fault
     def get_h323_gateway(self, name):
         """
         Get H323 Gateway parameters
         :param name: H323 Gateway name
         :return: result dictionary
         """
-        try:
-            return self.client.getH323Gateway(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getH323Gateway(name=name)
 
+    @invalidates_cache("h323_gateway")
+    @soap_fault
     def add_h323_gateway(self, **args):
         """
         Add H323 gateway
@@ -1752,50 +2089,46 @@ class Axl(object):
         :param clng_party_sub_trans_css:
         :return:
         """
-        try:
-            return self.client.addH323Gateway(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addH323Gateway(**args)
 
+    @invalidates_cache("h323_gateway")
+    @soap_fault
     def update_h323_gateway(self, **args):
         """
 
         :param name:
         :return:
         """
-        try:
-            return self.client.updateH323Gateway(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateH323Gateway(**args)
 
+    @invalidates_cache("h323_gateway")
+    @soap_fault
     def delete_h323_gateway(self, name):
         """
         Delete a H323 gateway
         :param name: The name of the H323 gateway to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeH323Gateway(name=name)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeH323Gateway(name=name)
 
     ##########################
     # ===== ROUTE GROUPS =====
     ##########################
 
+    @cached("route_group")
+    @soap_fault
     def get_route_groups(self, tagfilter={"name": "", "distributionAlgorithm": ""}):
         """
         Get route groups
         :param mini: return a list of tuples of route group details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listRouteGroup({"name": "%"}, returnedTags=tagfilter)[
-                "return"
-            ]["routeGroup"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listRouteGroup({"name": "%"}, returnedTags=tagfilter)[
+            "return"
+        ]["routeGroup"]
 
+    @cached("route_group")
+    @soap_fault
     def get_route_group(self, **args):
         """
         Get route group
@@ -1803,11 +2136,10 @@ class Axl(object):
         :param uuid: route group uuid
         :return: result dictionary
         """
-        try:
-            return self.client.getRouteGroup(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getRouteGroup(**args)
 
+    @invalidates_cache("route_group")
+    @soap_fault
     def add_route_group(self, name, distribution_algorithm="Top Down", members=[]):
         """
         Add a route group
@@ -1818,37 +2150,32 @@ class Axl(object):
         req = {
             "name": name,
             "distributionAlgorithm": distribution_algorithm,
-            "members": {"member": []},
-        }
-
-        if members:
-            [
-                req["members"]["member"].append(
+            "members": {
+                "member": [
                     {
                         "deviceName": i,
-                        "deviceSelectionOrder": members.index(i) + 1,
+                        "deviceSelectionOrder": idx,
                         "port": 0,
                     }
-                )
-                for i in members
-            ]
+                    for idx, i in enumerate(members, start=1)
+                ]
+            },
+        }
 
-        try:
-            return self.client.addRouteGroup(req)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addRouteGroup(req)
 
+    @invalidates_cache("route_group")
+    @soap_fault
     def delete_route_group(self, **args):
         """
         Delete a Route group
         :param name: The name of the Route group to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeRouteGroup(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeRouteGroup(**args)
 
+    @invalidates_cache("route_group")
+    @soap_fault
     def update_route_group(self, **args):
         """
         Update a Route group
@@ -1857,10 +2184,7 @@ class Axl(object):
         :param members: A list of devices to add (must already exist DUH!)
         :return: result dictionary
         """
-        try:
-            return self.client.updateRouteGroup(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateRouteGroup(**args)
 
     #########################
     # ===== ROUTE LISTS =====
@@ -1872,12 +2196,12 @@ class Axl(object):
         :param mini: return a list of tuples of route list details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listRouteList({"name": "%"}, returnedTags=tagfilter)[
-                "return"
-            ]["routeList"]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listRouteList,
+            data_label="routeList",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
 
     def get_route_list(self, **args):
         """
@@ -1917,29 +2241,17 @@ class Axl(object):
             "callManagerGroupName": cm_group_name,
             "routeListEnabled": route_list_enabled,
             "runOnEveryNode": run_on_all_nodes,
-            "members": {"member": []},
-        }
-
-        if members:
-            [
-                req["members"]["member"].append(
+            "members": {
+                "member": [
                     {
                         "routeGroupName": i,
-                        "selectionOrder": members.index(i) + 1,
-                        "calledPartyTransformationMask": "",
-                        "callingPartyTransformationMask": "",
-                        "digitDiscardInstructionName": "",
-                        "callingPartyPrefixDigits": "",
-                        "prefixDigitsOut": "",
-                        "useFullyQualifiedCallingPartyNumber": "Default",
-                        "callingPartyNumberingPlan": "Cisco CallManager",
-                        "callingPartyNumberType": "Cisco CallManager",
-                        "calledPartyNumberingPlan": "Cisco CallManager",
-                        "calledPartyNumberType": "Cisco CallManager",
+                        "selectionOrder": idx,
+                        **_ROUTE_LIST_MEMBER_DEFAULTS,
                     }
-                )
-                for i in members
-            ]
+                    for idx, i in enumerate(members, start=1)
+                ]
+            },
+        }
 
         try:
             return self.client.addRouteList(req)
@@ -1979,19 +2291,33 @@ class Axl(object):
     # ===== ROUTE PARTITIONS =====
     ##############################
 
+    @cached("route_partition")
     def get_partitions(self, tagfilter={"name": "", "description": ""}):
         """
         Get partitions
         :param mini: return a list of tuples of partition details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listRoutePartition(
-                {"name": "%"}, returnedTags=tagfilter
-            )["return"]["routePartition"]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listRoutePartition,
+            data_label="routePartition",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
+
+    def iter_partitions(self, tagfilter={"name": "", "description": ""}):
+        """
+        Same as get_partitions, but yields the partitions as each page of them is received
+        :return: A generator of partitions
+        """
+        yield from _iter_chunks(
+            self.client.listRoutePartition,
+            data_label="routePartition",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
 
+    @cached("route_partition")
     def get_partition(self, **args):
         """
         Get partition details
@@ -2004,6 +2330,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("route_partition")
     def add_partition(self, name, description="", time_schedule_name="All the time"):
         """
         Add a partition
@@ -2023,6 +2350,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("route_partition", "css")
     def delete_partition(self, **args):
         """
         Delete a partition
@@ -2034,6 +2362,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("route_partition", "css")
     def update_partition(self, **args):
         """
         Update calling search space
@@ -2055,19 +2384,21 @@ class Axl(object):
     # ===== CSS =====
     #################
 
+    @cached("css")
     def get_calling_search_spaces(self, tagfilter={"name": "", "description": ""}):
         """
         Get calling search spaces
         :param mini: return a list of tuples of css details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listCss({"name": "%"}, returnedTags=tagfilter)["return"][
-                "css"
-            ]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listCss,
+            data_label="css",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
 
+    @cached("css")
     def get_calling_search_space(self, **css):
         """
         Get Calling search space details
@@ -2080,6 +2411,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("css")
     def add_calling_search_space(self, name, description="", members=[]):
         """
         Add a Calling search space
@@ -2091,24 +2423,23 @@ class Axl(object):
         req = {
             "name": name,
             "description": description,
-            "members": {"member": []},
-        }
-        if members:
-            [
-                req["members"]["member"].append(
+            "members": {
+                "member": [
                     {
                         "routePartitionName": i,
-                        "index": members.index(i) + 1,
+                        "index": idx,
                     }
-                )
-                for i in members
-            ]
+                    for idx, i in enumerate(members, start=1)
+                ]
+            },
+        }
 
         try:
             return self.client.addCss(req)
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("css")
     def delete_calling_search_space(self, **args):
         """
         Delete a Calling search space
@@ -2120,6 +2451,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("css")
     def update_calling_search_space(self, **args):
         """
         Update calling search space
@@ -2149,41 +2481,54 @@ class Axl(object):
         :param mini: return a list of tuples of route pattern details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listRoutePattern(
-                {"pattern": "%"},
-                returnedTags=tagfilter,
-            )["return"]["routePattern"]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listRoutePattern,
+            data_label="routePattern",
+            searchCriteria={"pattern": "%"},
+            returnedTags=tagfilter,
+        )
+
+    def iter_route_patterns(
+        self, tagfilter={"pattern": "", "description": "", "uuid": ""}
+    ):
+        """
+        Same as get_route_patterns, but yields the route patterns as each page of them is received
+        :return: A generator of route patterns
+        """
+        yield from _iter_chunks(
+            self.client.listRoutePattern,
+            data_label="routePattern",
+            searchCriteria={"pattern": "%"},
+            returnedTags=tagfilter,
+        )
 
-    def get_route_pattern(self, pattern="", uuid=""):
+    @soap_fault
+    def get_route_pattern(self, pattern="", uuid="", partition=None):
         """
         Get route pattern
         :param pattern: route pattern
         :param uuid: route pattern uuid
+        :param partition: route partition of the pattern ("" for none). If given along with pattern, the route pattern is fetched in one request instead of finding its uuid first.
         :return: result dictionary
         """
-        if uuid == "" and pattern != "":
-            # Cant get pattern directly so get UUID first
-            try:
-                uuid = self.client.listRoutePattern(
-                    {"pattern": pattern}, returnedTags={"uuid": ""}
-                )
-            except Fault as e:
-                return e
+        if uuid == "" and pattern != "" and partition is not None:
+            return self.client.getRoutePattern(
+                pattern=pattern,
+                routePartitionName=partition or None,
+                dialPlanName=None,
+                routeFilterName=None,
+            )
+        elif uuid == "" and pattern != "":
+            # Cant get pattern directly without its partition, so get UUID first
+            uuid = self.client.listRoutePattern(
+                {"pattern": pattern}, returnedTags={"uuid": ""}
+            )
             if "return" in uuid and uuid["return"] is not None:
                 uuid = uuid["return"]["routePattern"][0]["uuid"]
-                try:
-                    return self.client.getRoutePattern(uuid=uuid)
-                except Fault as e:
-                    return e
+                return self.client.getRoutePattern(uuid=uuid)
 
         elif uuid != "" and pattern == "":
-            try:
-                return self.client.getRoutePattern(uuid=uuid)
-            except Fault as e:
-                return e
+            return self.client.getRoutePattern(uuid=uuid)
 
     def add_route_pattern(
         self,
@@ -2207,10 +2552,19 @@ class Axl(object):
         :return: result dictionary
         """
 
+        if gateway == "" and route_list == "":
+            return "Either a gateway OR route list, is a required parameter"
+        elif gateway != "" and route_list != "":
+            return "Enter a gateway OR route list, not both"
+        elif gateway != "":
+            destination = {"gatewayName": gateway}
+        else:
+            destination = {"routeListName": route_list}
+
         req = {
             "pattern": pattern,
             "description": description,
-            "destination": {},
+            "destination": destination,
             "routePartitionName": partition,
             "blockEnable": blockEnable,
             "releaseClause": releaseClause,
@@ -2218,16 +2572,6 @@ class Axl(object):
             "networkLocation": "OnNet",
         }
 
-        if gateway == "" and route_list == "":
-            return "Either a gateway OR route list, is a required parameter"
-
-        elif gateway != "" and route_list != "":
-            return "Enter a gateway OR route list, not both"
-
-        elif gateway != "":
-            req["destination"].update({"gatewayName": gateway})
-        elif route_list != "":
-            req["destination"].update({"routeListName": route_list})
         try:
             return self.client.addRoutePattern(req)
         except Fault as e:
@@ -2268,19 +2612,21 @@ class Axl(object):
     # ===== MEDIA RESOURCE GROUPS =====
     ###################################
 
+    @cached("media_resource_group")
     def get_media_resource_groups(self, tagfilter={"name": "", "description": ""}):
         """
         Get media resource groups
         :param mini: return a list of tuples of route pattern details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listMediaResourceGroup(
-                {"name": "%"}, returnedTags=tagfilter
-            )["return"]["mediaResourceGroup"]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listMediaResourceGroup,
+            data_label="mediaResourceGroup",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
 
+    @cached("media_resource_group")
     def get_media_resource_group(self, name):
         """
         Get a media resource group details
@@ -2292,6 +2638,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("media_resource_group")
     def add_media_resource_group(
         self, name, description="", multicast="false", members=[]
     ):
@@ -2307,17 +2654,15 @@ class Axl(object):
             "name": name,
             "description": description,
             "multicast": multicast,
-            "members": {"member": []},
+            "members": {"member": [{"deviceName": i} for i in members]},
         }
 
-        if members:
-            [req["members"]["member"].append({"deviceName": i}) for i in members]
-
         try:
             return self.client.addMediaResourceGroup(req)
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("media_resource_group", "media_resource_group_list")
     def update_media_resource_group(self, **args):
         """
         Update a media resource group
@@ -2332,6 +2677,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("media_resource_group", "media_resource_group_list")
     def delete_media_resource_group(self, name):
         """
         Delete a Media resource group
@@ -2343,19 +2689,21 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @cached("media_resource_group_list")
     def get_media_resource_group_lists(self, tagfilter={"name": ""}):
         """
         Get media resource groups
         :param mini: return a list of tuples of route pattern details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listMediaResourceList(
-                {"name": "%"}, returnedTags=tagfilter
-            )["return"]["mediaResourceList"]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listMediaResourceList,
+            data_label="mediaResourceList",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
 
+    @cached("media_resource_group_list")
     def get_media_resource_group_list(self, name):
         """
         Get a media resource group list details
@@ -2367,6 +2715,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("media_resource_group_list")
     def add_media_resource_group_list(self, name, members=[]):
         """
         Add a media resource group list
@@ -2374,20 +2723,21 @@ class Axl(object):
         :param members: A list of members
         :return:
         """
-        req = {"name": name, "members": {"member": []}}
-
-        if members:
-            [
-                req["members"]["member"].append(
-                    {"order": members.index(i), "mediaResourceGroupName": i}
-                )
-                for i in members
-            ]
+        req = {
+            "name": name,
+            "members": {
+                "member": [
+                    {"order": idx, "mediaResourceGroupName": i}
+                    for idx, i in enumerate(members)
+                ]
+            },
+        }
         try:
             return self.client.addMediaResourceList(req)
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("media_resource_group_list", "device_pool")
     def update_media_resource_group_list(self, **args):
         """
         Update a media resource group list
@@ -2402,6 +2752,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("media_resource_group_list", "device_pool")
     def delete_media_resource_group_list(self, name):
         """
         Delete a Media resource group list
@@ -2453,9 +2804,11 @@ class Axl(object):
         """
         tags = _tag_handler(return_tags)
 
+        # big clusters have many pages of these, so fetch a few at a time
         return _chunk_data(
             self.client.listLine,
             data_label="line",
+            window=4,
             searchCriteria={
                 "pattern": pattern,
                 "description": description,
@@ -2464,6 +2817,7 @@ class Axl(object):
             returnedTags=tags,
         )
 
+    @cached("directory_number")
     @serialize
     @check_tags("getLine")
     def get_directory_number(
@@ -2499,6 +2853,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("directory_number")
     @check_arguments("addLine", child="line")
     def add_directory_number(
         self,
@@ -2510,7 +2865,7 @@ class Axl(object):
         **kwargs,
     ):
         # check pattern validity
-        if not re.match(r"^[0-9\?\!\\\[\]\+\-\*\^\#X]+$", pattern):
+        if not pattern or not _DN_CHARS.issuperset(pattern):
             raise InvalidArguments(f"Invalid pattern '{pattern}'")
 
         # check route partition exists
@@ -2520,7 +2875,7 @@ class Axl(object):
             raise InvalidArguments(f"Route Partition {route_partition} does not exist")
 
         # check template
-        if type(template_name) == str and type(template_route_partition) == str:
+        if isinstance(template_name, str) and isinstance(template_route_partition, str):
             try:
                 template_line = self._from_line_template(
                     template_name,
@@ -2551,6 +2906,7 @@ class Axl(object):
                 [],
             )
 
+    @invalidates_cache("directory_number", "phone")
     @serialize
     @operation_tag("removeLine")
     def delete_directory_number(self, uuid="", pattern="", route_partition="") -> dict:
@@ -2594,6 +2950,7 @@ class Axl(object):
                 "If not using a uuid, both pattern and route_partition must be provided."
             )
 
+    @invalidates_cache("phone", "directory_number")
     @serialize
     @operation_tag("updateLine")
     def update_directory_number(
@@ -2625,7 +2982,7 @@ class Axl(object):
         elif pattern != "" and route_partition != "":
             try:
                 return self.client.updateLine(
-                    pattern=pattern, route_partition=route_partition, **kwargs
+                    pattern=pattern, routePartitionName=route_partition, **kwargs
                 )
             except Fault as e:
                 return e
@@ -2634,6 +2991,7 @@ class Axl(object):
                 "If not using a uuid, both pattern and route_partition must be provided."
             )
 
+    @cached("route_partition")
     @serialize
     @check_tags("getRoutePartition")
     def get_route_partition(self, name="", uuid="", *, return_tags=[]) -> dict:
@@ -2654,13 +3012,14 @@ class Axl(object):
         :param mini: return a list of tuples of CTI route point details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listCtiRoutePoint({"name": "%"}, returnedTags=tagfilter)[
-                "return"
-            ]["ctiRoutePoint"]
-        except Fault as e:
-            raise AXLFault(e)
+        return _chunk_data(
+            self.client.listCtiRoutePoint,
+            data_label="ctiRoutePoint",
+            searchCriteria={"name": "%"},
+            returnedTags=tagfilter,
+        )
 
+    @soap_fault
     def get_cti_route_point(self, **args):
         """
         Get CTI route point details
@@ -2668,11 +3027,9 @@ class Axl(object):
         :param uuid: CTI route point uuid
         :return: result dictionary
         """
-        try:
-            return self.client.getCtiRoutePoint(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getCtiRoutePoint(**args)
 
+    @soap_fault
     def add_cti_route_point(
         self,
         name,
@@ -2719,36 +3076,29 @@ class Axl(object):
             "devicePoolName": device_pool,
             "locationName": location,
             "useTrustedRelayPoint": use_trusted_relay_point,
-            "lines": {"line": []},
-        }
-
-        if lines:
-            [
-                req["lines"]["line"].append(
+            "lines": {
+                "line": [
                     {
-                        "index": lines.index(i) + 1,
+                        "index": idx,
                         "dirn": {"pattern": i[0], "routePartitionName": i[1]},
                     }
-                )
-                for i in lines
-            ]
+                    for idx, i in enumerate(lines, start=1)
+                ]
+            },
+        }
 
-        try:
-            return self.client.addCtiRoutePoint(req)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addCtiRoutePoint(self._typed("XCtiRoutePoint", req))
 
+    @soap_fault
     def delete_cti_route_point(self, **args):
         """
         Delete a CTI route point
         :param cti_route_point: The name of the CTI route point to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeCtiRoutePoint(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeCtiRoutePoint(**args)
 
+    @soap_fault
     def update_cti_route_point(self, **args):
         """
         Add CTI route point
@@ -2768,10 +3118,7 @@ class Axl(object):
         :param lines: A list of tuples of [(directory_number, partition)]
         :return:
         """
-        try:
-            return self.client.updateCtiRoutePoint(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateCtiRoutePoint(**args)
 
     ####################
     # ===== PHONES =====
@@ -2787,20 +3134,15 @@ class Axl(object):
         device_pool="%",
         security_profile="%",
         *,
-        return_tags=[
-            "name",
-            "product",
-            "description",
-            "protocol",
-            "locationName",
-            "callingSearchSpaceName",
-        ],
+        return_tags=_PHONE_LIST_TAGS,
     ) -> list[dict]:
         tags: dict = _tag_handler(return_tags)
 
+        # big clusters have many pages of these, so fetch a few at a time
         return _chunk_data(
             self.client.listPhone,
             data_label="phone",
+            window=4,
             searchCriteria={
                 "name": name,
                 "description": description,
@@ -2811,6 +3153,7 @@ class Axl(object):
             returnedTags=tags,
         )
 
+    @cached("phone")
     @serialize
     @check_tags("getPhone")
     def get_phone(self, uuid="", name="", *, return_tags=[]):
@@ -2846,33 +3189,25 @@ class Axl(object):
         if dev["lines"] is None:
             return []
 
-        lines = [
-            (dn["dirn"]["pattern"], dn["dirn"]["routePartitionName"])
+        kwargs_list = [
+            {
+                "pattern": dn["dirn"]["pattern"],
+                "route_partition": dn["dirn"]["routePartitionName"],
+                "return_tags": return_tags,
+            }
             for dn in dev["lines"]["line"]
         ]
 
-        if main_line_only or len(lines) == 1:
-            return [
-                self.get_directory_number(
-                    pattern=lines[0][0],
-                    route_partition=lines[0][1],
-                    return_tags=return_tags,
-                )
-            ]
+        if main_line_only or len(kwargs_list) == 1:
+            return [self.get_directory_number(**kwargs_list[0])]
         else:
             return self._multithread(
-                method=self.get_directory_number,
-                kwargs_list=[
-                    {
-                        "pattern": line[0],
-                        "route_partition": line[1],
-                        "return_tags": return_tags,
-                    }
-                    for line in lines
-                ],
+                method=self.get_directory_number, kwargs_list=kwargs_list
             )
 
+    @invalidates_cache("phone", "directory_number")
     @check_arguments("addPhone", child="phone")
+    @soap_fault
     def add_phone(
         self,
         dev_name: str,
@@ -2941,23 +3276,21 @@ class Axl(object):
             }
 
         add_tags.update(kwargs)
-        try:
-            return self.client.addPhone(phone=add_tags)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.addPhone(phone=self._typed("XPhone", add_tags))
 
+    @invalidates_cache("phone", "directory_number")
+    @soap_fault
     def delete_phone(self, **args):
         """
         Delete a phone
         :param phone: The name of the phone to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removePhone(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removePhone(**args)
 
+    @invalidates_cache("phone", "directory_number")
     @check_arguments("updatePhone")
+    @soap_fault
     def update_phone(
         self,
         name: str,
@@ -2988,44 +3321,96 @@ class Axl(object):
         if (
             user := axl_args.get("ownerUserName", None)
         ) is not None and user.lower() == "anonymous":
-            axl_args["ownerUserName"] = ""
-
-        try:
-            return self.client.updatePhone(**axl_args)
-        except Fault as e:
-            raise AXLFault(e)
+            axl_args["ownerUserName"] = ""
+
+        return self.client.updatePhone(**axl_args)
 
+    @invalidates_cache("phone", "directory_number")
     def add_phone_line(
         self, dev_name: str, dn: tuple[str, str], position=0, replace=False
     ):
-        # get current device lines
-        try:
-            device = self.get_phone(name=dev_name, return_tags=["lines"])
-        except AXLFault as e:
-            raise AXLFaultHandler(f"Could not find phone {dev_name} to add line to:", e)
+        """Adds a line to a phone. To add several lines, use set_phone_lines so they go out in one request.
 
-        # check if dn exists
-        try:
-            self.get_directory_number(*dn)
-        except AXLFault as e:
-            raise AXLFaultHandler(f"Could not find line {dn} to add to {dev_name}:", e)
-
-        # convert lines to lineIdentifier format
-        dn_to_id = lambda x: {"directoryNumber": x[0], "routePartitionName": x[1]}
-        if (line_list := device["lines"]) is not None:
-            original_dns = [
-                (d["dirn"]["pattern"], d["dirn"]["routePartitionName"])
-                for d in line_list["line"]
-            ]
-            line_ids = [dn_to_id(d) for d in original_dns]
-        else:
-            line_ids = []
+        Parameters
+        ----------
+        dev_name : str
+            Name of the phone
+        dn : tuple[str, str]
+            (pattern, route partition) of the line
+        position : int, optional
+            Line index to insert the line at, by default 0 (after the phone's current lines)
+        replace : bool, optional
+            If True, `dn` becomes the phone's only line, by default False
+
+        Raises
+        ------
+        AXLFaultHandler
+            If the phone or the DN can't be found, or the update is rejected by AXL
+        """
+        self.set_phone_lines(dev_name, [dn], position=position, replace=replace)
 
-        # insert new line into list
+    @invalidates_cache("phone", "directory_number")
+    def set_phone_lines(
+        self,
+        dev_name: str,
+        dns: list[tuple[str, str]],
+        position=0,
+        replace=False,
+        validate=True,
+    ):
+        """Adds several lines to a phone with a single updatePhone request, instead of one add_phone_line per line.
+
+        Parameters
+        ----------
+        dev_name : str
+            Name of the phone
+        dns : list[tuple[str, str]]
+            (pattern, route partition) of each line, in the order they should appear on the phone
+        position : int, optional
+            Line index to insert the new lines at, by default 0 (after the phone's current lines)
+        replace : bool, optional
+            If True, the phone's lines are replaced with `dns` and its current lines aren't looked up, by default False
+        validate : bool, optional
+            If True, makes sure every DN exists before updating the phone, by default True
+
+        Raises
+        ------
+        AXLFaultHandler
+            If the phone or one of the DNs can't be found, or the update is rejected by AXL
+        """
+        line_ids = [] if replace else self._current_line_ids(dev_name)
+
+        if validate:
+            try:
+                self._multithread(
+                    self.get_directory_number,
+                    [
+                        {
+                            "pattern": d[0],
+                            "route_partition": d[1],
+                            "return_tags": ["pattern"],
+                        }
+                        for d in dns
+                    ],
+                )
+            except MultithreadException as e:
+                dn = (e.kw["pattern"], e.kw["route_partition"])
+                if isinstance(e.res_exc, AXLFault):
+                    raise AXLFaultHandler(
+                        f"Could not find line {dn} to add to {dev_name}:", e.res_exc
+                    )
+                raise e.res_exc
+
+        # insert new lines into list
+        new_ids = [_line_identifier(d) for d in dns]
         if position == 0:
-            line_ids.append(dn_to_id(dn))
+            line_ids.extend(new_ids)
         else:
-            line_ids.insert(position - 1, dn_to_id(dn))
+            line_ids[position - 1 : position - 1] = new_ids
+
+        if not line_ids:
+            # zeep leaves an empty <lines> out of the request, so the update would do nothing
+            raise InvalidArguments(f"Can't leave {dev_name} without any lines")
 
         # replace device lines with new list
         try:
@@ -3036,21 +3421,51 @@ class Axl(object):
         except Fault as e:
             # ugly but don't care right now
             raise AXLFaultHandler(
-                f"Could not add line {dn} to {dev_name}:", AXLFault(e)
+                f"Could not add lines {dns} to {dev_name}:", AXLFault(e)
             )
         except Exception as e:
             raise AXLError(
-                f"Could not add line {dn} to {dev_name} due to an unknown error:", e
+                f"Could not add lines {dns} to {dev_name} due to an unknown error:", e
             )
 
+    def _current_line_ids(self, dev_name: str) -> list[dict]:
+        """Gets the lines currently on a phone, in the lineIdentifier format updatePhone expects. Do not use."""
+        try:
+            device = self.get_phone(name=dev_name, return_tags=["lines"])
+        except AXLFault as e:
+            raise AXLFaultHandler(f"Could not find phone {dev_name} to add line to:", e)
+
+        return _lines_to_ids(device["lines"])
+
+    @invalidates_cache("phone", "directory_number")
     def remove_phone_line(self, dev_name: str, dn=None, index=0, cascade=True):
-        # make sure user chose something
-        if not any(dn, index):
+        """Removes a line from a phone, picked either by its DN or by its line index.
+
+        Parameters
+        ----------
+        dev_name : str
+            Name of the phone
+        dn : tuple[str, str], optional
+            (pattern, route partition) of the line to remove
+        index : int, optional
+            Line index (starting at 1) of the line to remove
+        cascade : bool, optional
+            If True, the lines after the removed one move up to fill its spot, otherwise they keep their line indexes, by default True
+
+        Raises
+        ------
+        InvalidArguments
+            If neither or both of `dn` and `index` are given, `index` is less than 1, the line isn't on the phone, or it is the phone's only line (AXL can't leave a phone without lines)
+        AXLFaultHandler
+            If the phone can't be found, or the update is rejected by AXL
+        """
+        # make sure user chose something (and only one thing)
+        if dn and index:
+            raise InvalidArguments(f"Please only provide either a DN or a line index")
+        elif not dn and index < 1:
             raise InvalidArguments(
-                f"Must provide either a DN pattern or a phone line index"
+                f"Must provide either a DN pattern or a phone line index (starting at 1)"
             )
-        elif all(dn, index):
-            raise InvalidArguments(f"Please only provide either a DN or a line index")
 
         # get phone lines
         try:
@@ -3060,31 +3475,68 @@ class Axl(object):
                 f"Could not find phone {dev_name} to remove line from:", e
             )
 
-        if (original_lines := device["lines"]) is None:
-            return None
+        lines = device["lines"]["line"] if device["lines"] is not None else []
 
         # find matching line
         if dn:
-            match_dn = (
-                lambda x: x["dirn"]["pattern"] == dn[0]
-                and x["dirn"]["routePartitionName"] == dn[1]
+            to_delete = next(
+                (
+                    x
+                    for x in lines
+                    if x["dirn"]["pattern"] == dn[0]
+                    and x["dirn"]["routePartitionName"] == dn[1]
+                ),
+                None,
             )
-            matches = filter(match_dn, original_lines["line"])
-            if not matches:
-                print(f"(Couldn't find {dn} in {dev_name} to delete, skipping...)")
-            else:
-                to_delete = matches[0]
+            if to_delete is None:
+                raise InvalidArguments(f"Couldn't find {dn} on {dev_name} to remove")
         else:
-            by_index = lambda x: x["index"]
-            ordered_lines = sorted(original_lines["line"], key=by_index)
-            if index > len(ordered_lines):
-                raise Exception(
-                    f"{dev_name} only has {len(ordered_lines)}, can't delete Index {index}"
+            if index > len(lines):
+                raise InvalidArguments(
+                    f"{dev_name} only has {len(lines)} line(s), can't remove index {index}"
                 )
-            else:
-                to_delete = ordered_lines[index - 1]
+            # AXL hands lines back in index order, only sort if it didn't
+            if any(a["index"] > b["index"] for a, b in zip(lines, lines[1:])):
+                lines = sorted(lines, key=itemgetter("index"))
+            to_delete = lines[index - 1]
+
+        remaining = [x for x in lines if x is not to_delete]
+        if not remaining:
+            # zeep leaves an empty <lines> out of the request, so the update would do nothing
+            raise InvalidArguments(f"Can't remove the only line of {dev_name}")
+
+        if cascade:
+            # put every other line back on the phone, in order
+            self.set_phone_lines(
+                dev_name,
+                [_dirn_key(x["dirn"]) for x in remaining],
+                replace=True,
+                validate=False,
+            )
+            return
 
-        # ! not finished
+        # keep every other line at its current index
+        try:
+            self.client.updatePhone(
+                name=dev_name,
+                lines={
+                    "line": [
+                        {
+                            "index": x["index"],
+                            "dirn": {
+                                "pattern": x["dirn"]["pattern"],
+                                "routePartitionName": x["dirn"]["routePartitionName"],
+                            },
+                        }
+                        for x in remaining
+                    ]
+                },
+            )
+        except Fault as e:
+            raise AXLFaultHandler(
+                f"Could not remove line {_dirn_key(to_delete['dirn'])} from {dev_name}:",
+                AXLFault(e),
+            )
 
     def update_phone_line(self):
         pass
@@ -3111,6 +3563,7 @@ class Axl(object):
     # ===== DEVICE PROFILES =====
     #############################
 
+    @soap_fault
     def get_device_profiles(
         self,
         tagfilter={
@@ -3125,14 +3578,15 @@ class Axl(object):
         :param mini: return a list of tuples of device profile details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listDeviceProfile(
-                {"name": "%"},
-                returnedTags=tagfilter,
-            )["return"]["deviceProfile"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.listDeviceProfile(
+            {"name": "%"},
+            returnedTags=tagfilter,
+        )[
+            "return"
+        ]["deviceProfile"]
 
+    @cached("device_profile")
+    @soap_fault
     def get_device_profile(self, **args):
         """
         Get device profile parameters
@@ -3140,11 +3594,9 @@ class Axl(object):
         :param uuid: profile uuid
         :return: result dictionary
         """
-        try:
-            return self.client.getDeviceProfile(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getDeviceProfile(**args)
 
+    @invalidates_cache("device_profile")
     def add_device_profile(
         self,
         name,
@@ -3186,41 +3638,39 @@ class Axl(object):
             "protocolSide": protocolSide,
             "softkeyTemplateName": softkey_template,
             "phoneTemplateName": phone_template,
-            "lines": {"line": []},
-        }
-
-        if lines:
-            [
-                req["lines"]["line"].append(
+            "lines": {
+                "line": [
                     {
-                        "index": lines.index(i) + 1,
+                        "index": idx,
                         "dirn": {"pattern": i[0], "routePartitionName": i[1]},
                         "display": i[2],
                         "displayAscii": i[3],
                         "label": i[4],
                         "e164Mask": i[5],
                     }
-                )
-                for i in lines
-            ]
+                    for idx, i in enumerate(lines, start=1)
+                ]
+            },
+        }
 
         try:
-            blah = self.client.addDeviceProfile(req)
+            blah = self.client.addDeviceProfile(self._typed("XDeviceProfile", req))
             return blah
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("device_profile")
+    @soap_fault
     def delete_device_profile(self, **args):
         """
         Delete a device profile
         :param profile: The name of the device profile to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeDeviceProfile(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeDeviceProfile(**args)
 
+    @invalidates_cache("device_profile")
+    @soap_fault
     def update_device_profile(self, **args):
         """
         Update A Device profile for use with extension mobility
@@ -3240,10 +3690,7 @@ class Axl(object):
         :param em_service_name:
         :return:
         """
-        try:
-            return self.client.updateDeviceProfile(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateDeviceProfile(**args)
 
     ###################
     # ===== USERS =====
@@ -3254,35 +3701,38 @@ class Axl(object):
         Get users details
         :return: A list of dictionary's
         """
-        skip = 0
-        a = []
-
-        def inner(skip):
-            while True:
-                res = self.client.listUser(
-                    {"userid": "%"}, returnedTags=tagfilter, first=1000, skip=skip
-                )["return"]
-                skip = skip + 1000
-                if res is not None and "user" in res:
-                    yield res["user"]
-                else:
-                    break
+        # user directories can be large, so fetch a few pages at a time
+        return _chunk_data(
+            self.client.listUser,
+            data_label="user",
+            window=4,
+            searchCriteria={"userid": "%"},
+            returnedTags=tagfilter,
+        )
 
-        for each in inner(skip):
-            a.extend(each)
-        return a
+    def iter_users(self, tagfilter={"userid": "", "firstName": "", "lastName": ""}):
+        """
+        Same as get_users, but yields the users as each window of pages is received
+        :return: A generator of users
+        """
+        yield from _iter_chunks(
+            self.client.listUser,
+            data_label="user",
+            window=4,
+            searchCriteria={"userid": "%"},
+            returnedTags=tagfilter,
+        )
 
+    @soap_fault
     def get_user(self, userid):
         """
         Get user parameters
         :param user_id: profile name
         :return: result dictionary
         """
-        try:
-            return self.client.getUser(userid=userid)["return"]["user"]
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.getUser(userid=userid)["return"]["user"]
 
+    @soap_fault
     def add_user(
         self,
         userid,
@@ -3299,19 +3749,20 @@ class Axl(object):
         :return: result dictionary
         """
 
-        try:
-            return self.client.addUser(
+        return self.client.addUser(
+            self._typed(
+                "XUser",
                 {
                     "userid": userid,
                     "lastName": lastName,
                     "firstName": firstName,
                     "presenceGroupName": presenceGroupName,
                     "phoneProfiles": phoneProfiles,
-                }
+                },
             )
-        except Fault as e:
-            raise AXLFault(e)
+        )
 
+    @soap_fault
     def update_user(self, **args):
         """
         Update end user for credentials
@@ -3320,10 +3771,7 @@ class Axl(object):
         :param pin: Extension mobility PIN
         :return: result dictionary
         """
-        try:
-            return self.client.updateUser(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.updateUser(**args)
 
     def update_user_em(
         self, user_id, device_profile, default_profile, subscribe_css, primary_extension
@@ -3337,12 +3785,7 @@ class Axl(object):
         :param primary_extension: Primary extension, must be a number from the device profile
         :return: result dictionary
         """
-        try:
-            resp = self.client.getDeviceProfile(name=device_profile)
-        except Fault as e:
-            raise AXLFault(e)
-        if "return" in resp and resp["return"] is not None:
-            uuid = resp["return"]["deviceProfile"]["uuid"]
+        if (uuid := self._device_profile_uuid(device_profile)) is not None:
             try:
                 return self.client.updateUser(
                     userid=user_id,
@@ -3357,6 +3800,17 @@ class Axl(object):
         else:
             return "Device Profile not found for user"
 
+    @cached("device_profile")
+    def _device_profile_uuid(self, name: str) -> Union[str, None]:
+        """Looks up a device profile's uuid by name, asking AXL for as little of the profile as possible. Do not use."""
+        try:
+            resp = self.client.getDeviceProfile(name=name, returnedTags=_NAME_TAGS)
+        except Fault as e:
+            raise AXLFault(e)
+        if "return" in resp and resp["return"] is not None:
+            return resp["return"]["deviceProfile"]["uuid"]
+        return None
+
     def update_user_credentials(self, userid, password="", pin=""):
         """
         Update end user for credentials
@@ -3369,34 +3823,20 @@ class Axl(object):
         if password == "" and pin == "":
             return "Password and/or Pin are required"
 
-        elif password != "" and pin != "":
-            try:
-                return self.client.updateUser(userid=userid, password=password, pin=pin)
-            except Fault as e:
-                return e
-
-        elif password != "":
-            try:
-                return self.client.updateUser(userid=userid, password=password)
-            except Fault as e:
-                return e
-
-        elif pin != "":
-            try:
-                return self.client.updateUser(userid=userid, pin=pin)
-            except Fault as e:
-                return e
+        # only send the credentials that were given
+        try:
+            return self.client.updateUser(**filter_empty_kwargs(locals()))
+        except Fault as e:
+            return e
 
+    @soap_fault
     def delete_user(self, **args):
         """
         Delete a user
         :param userid: The name of the user to delete
         :return: result dictionary
         """
-        try:
-            return self.client.removeUser(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        return self.client.removeUser(**args)
 
     ##################################
     # ===== TRANSLATION PATTERNS =====
@@ -3408,28 +3848,19 @@ class Axl(object):
         :param mini: return a list of tuples of route pattern details
         :return: A list of dictionary's
         """
-        try:
-            return self.client.listTransPattern(
-                {"pattern": "%"},
-                returnedTags={
-                    "pattern": "",
-                    "description": "",
-                    "uuid": "",
-                    "routePartitionName": "",
-                    "callingSearchSpaceName": "",
-                    "useCallingPartyPhoneMask": "",
-                    "patternUrgency": "",
-                    "provideOutsideDialtone": "",
-                    "prefixDigitsOut": "",
-                    "calledPartyTransformationMask": "",
-                    "callingPartyTransformationMask": "",
-                    "digitDiscardInstructionName": "",
-                    "callingPartyPrefixDigits": "",
-                    "provideOutsideDialtone": "",
-                },
-            )["return"]["transPattern"]
-        except Fault as e:
-            raise AXLFault(e)
+        return list(self.iter_translations())
+
+    def iter_translations(self):
+        """
+        Same as get_translations, but yields the translation patterns as each page of them is received
+        :return: A generator of translation patterns
+        """
+        yield from _iter_chunks(
+            self.client.listTransPattern,
+            data_label="transPattern",
+            searchCriteria={"pattern": "%"},
+            returnedTags=_TRANS_PATTERN_LIST_TAGS,
+        )
 
     def get_translation(self, pattern="", routePartitionName="", uuid=""):
         """
@@ -3445,20 +3876,7 @@ class Axl(object):
                 return self.client.getTransPattern(
                     pattern=pattern,
                     routePartitionName=routePartitionName,
-                    returnedTags={
-                        "pattern": "",
-                        "description": "",
-                        "routePartitionName": "",
-                        "callingSearchSpaceName": "",
-                        "useCallingPartyPhoneMask": "",
-                        "patternUrgency": "",
-                        "provideOutsideDialtone": "",
-                        "prefixDigitsOut": "",
-                        "calledPartyTransformationMask": "",
-                        "callingPartyTransformationMask": "",
-                        "digitDiscardInstructionName": "",
-                        "callingPartyPrefixDigits": "",
-                    },
+                    returnedTags=_TRANS_PATTERN_TAGS,
                 )
             except Fault as e:
                 return e
@@ -3466,26 +3884,14 @@ class Axl(object):
             try:
                 return self.client.getTransPattern(
                     uuid=uuid,
-                    returnedTags={
-                        "pattern": "",
-                        "description": "",
-                        "routePartitionName": "",
-                        "callingSearchSpaceName": "",
-                        "useCallingPartyPhoneMask": "",
-                        "patternUrgency": "",
-                        "provideOutsideDialtone": "",
-                        "prefixDigitsOut": "",
-                        "calledPartyTransformationMask": "",
-                        "callingPartyTransformationMask": "",
-                        "digitDiscardInstructionName": "",
-                        "callingPartyPrefixDigits": "",
-                    },
+                    returnedTags=_TRANS_PATTERN_TAGS,
                 )
             except Fault as e:
                 return e
         else:
             return "must specify either uuid OR pattern and partition"
 
+    @soap_fault
     def add_translation(
         self,
         pattern,
@@ -3521,8 +3927,9 @@ class Axl(object):
         :param blockEnable: - optional
         :return: result dictionary
         """
-        try:
-            return self.client.addTransPattern(
+        return self.client.addTransPattern(
+            self._typed(
+                "XTransPattern",
                 {
                     "pattern": pattern,
                     "description": description,
@@ -3538,10 +3945,9 @@ class Axl(object):
                     "digitDiscardInstructionName": digitDiscardInstructionName,
                     "callingPartyPrefixDigits": callingPartyPrefixDigits,
                     "blockEnable": blockEnable,
-                }
+                },
             )
-        except Fault as e:
-            raise AXLFault(e)
+        )
 
     def delete_translation(self, pattern="", partition="", uuid=""):
         """
@@ -3567,6 +3973,7 @@ class Axl(object):
         else:
             return "must specify either uuid OR pattern and partition"
 
+    @soap_fault
     def update_translation(
         self,
         pattern="",
@@ -3605,42 +4012,14 @@ class Axl(object):
         :return: result dictionary
         """
 
-        args = {}
-        if description != "":
-            args["description"] = description
-        if pattern != "" and partition != "" and uuid == "":
-            args["pattern"] = pattern
-            args["routePartitionName"] = partition
-        if pattern == "" and partition == "" and uuid != "":
-            args["uuid"] = uuid
-        if newPattern != "":
-            args["newPattern"] = newPattern
-        if newRoutePartitionName != "":
-            args["newRoutePartitionName"] = newRoutePartitionName
-        if callingSearchSpaceName != "":
-            args["callingSearchSpaceName"] = callingSearchSpaceName
-        if useCallingPartyPhoneMask != "":
-            args["useCallingPartyPhoneMask"] = useCallingPartyPhoneMask
-        if digitDiscardInstructionName != "":
-            args["digitDiscardInstructionName"] = digitDiscardInstructionName
-        if callingPartyTransformationMask != "":
-            args["callingPartyTransformationMask"] = callingPartyTransformationMask
-        if calledPartyTransformationMask != "":
-            args["calledPartyTransformationMask"] = calledPartyTransformationMask
-        if patternUrgency != "":
-            args["patternUrgency"] = patternUrgency
-        if provideOutsideDialtone != "":
-            args["provideOutsideDialtone"] = provideOutsideDialtone
-        if prefixDigitsOut != "":
-            args["prefixDigitsOut"] = prefixDigitsOut
-        if callingPartyPrefixDigits != "":
-            args["callingPartyPrefixDigits"] = callingPartyPrefixDigits
-        if blockEnable != "":
-            args["blockEnable"] = blockEnable
-        try:
-            return self.client.updateTransPattern(**args)
-        except Fault as e:
-            raise AXLFault(e)
+        args = filter_empty_kwargs(locals(), {"partition": "routePartitionName"})
+        # the pattern is identified by pattern + partition or by uuid, never a mix of both
+        if uuid != "" or pattern == "" or partition == "":
+            args.pop("pattern", None)
+            args.pop("routePartitionName", None)
+        if pattern != "" or partition != "":
+            args.pop("uuid", None)
+        return self.client.updateTransPattern(**args)
 
     ########################
     # ===== ROUTE PLAN =====
@@ -3655,12 +4034,7 @@ class Axl(object):
         try:
             return self.client.listRoutePlan(
                 {"dnOrPattern": "%" + pattern + "%"},
-                returnedTags={
-                    "dnOrPattern": "",
-                    "partition": "",
-                    "type": "",
-                    "routeDetail": "",
-                },
+                returnedTags=_ROUTE_PLAN_TAGS,
             )["return"]["routePlan"]
         except Fault as e:
             raise AXLFault(e)
@@ -3674,12 +4048,7 @@ class Axl(object):
         try:
             return self.client.listRoutePlan(
                 {"dnOrPattern": pattern},
-                returnedTags={
-                    "dnOrPattern": "",
-                    "partition": "",
-                    "type": "",
-                    "routeDetail": "",
-                },
+                returnedTags=_ROUTE_PLAN_TAGS,
             )
         except Fault as e:
             raise AXLFault(e)
@@ -3693,7 +4062,7 @@ class Axl(object):
         try:
             return self.client.listCalledPartyTransformationPattern(
                 {"pattern": "%"},
-                returnedTags={"pattern": "", "description": "", "uuid": ""},
+                returnedTags=_XFORM_LIST_TAGS,
             )["return"]["calledPartyTransformationPattern"]
         except Fault as e:
             raise AXLFault(e)
@@ -3794,7 +4163,7 @@ class Axl(object):
         try:
             return self.client.listCallingPartyTransformationPattern(
                 {"pattern": "%"},
-                returnedTags={"pattern": "", "description": "", "uuid": ""},
+                returnedTags=_XFORM_LIST_TAGS,
             )["return"]["callingPartyTransformationPattern"]
         except Fault as e:
             raise AXLFault(e)
@@ -3938,12 +4307,14 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @cached("sip_security_profile")
     def get_sip_security_profile(self, name):
         try:
             return self.client.getSipTrunkSecurityProfile(name=name)["return"]
         except Fault as e:
             raise AXLFault(e)
 
+    @cached("sip_profile")
     def get_sip_profile(self, name):
         try:
             return self.client.getSipProfile(name=name)["return"]
@@ -3976,15 +4347,17 @@ class Axl(object):
     # ===== SERVERS & CM GROUPS =====
     #################################
 
+    @cached("process_node")
     def list_process_nodes(self):
         try:
             return self.client.listProcessNode(
                 {"name": "%", "processNodeRole": "CUCM Voice/Video"},
-                returnedTags={"name": ""},
+                returnedTags=_NAME_TAGS,
             )["return"]["processNode"]
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("call_manager_group")
     def add_call_manager_group(self, name, members):
         """
         Add call manager group
@@ -3998,6 +4371,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @cached("call_manager_group")
     def get_call_manager_group(self, name):
         """
         Get call manager group
@@ -4009,6 +4383,7 @@ class Axl(object):
         except Fault as e:
             raise AXLFault(e)
 
+    @cached("call_manager_group")
     def get_call_manager_groups(self):
         """
         Get call manager groups
@@ -4017,11 +4392,12 @@ class Axl(object):
         """
         try:
             return self.client.listCallManagerGroup(
-                {"name": "%"}, returnedTags={"name": ""}
+                {"name": "%"}, returnedTags=_NAME_TAGS
             )["return"]["callManagerGroup"]
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("call_manager_group")
     def update_call_manager_group(self, **args):
         """
         Update call manager group
@@ -4029,10 +4405,11 @@ class Axl(object):
         :return: result dictionary
         """
         try:
-            return self.client.listCallManagerGroup({**args}, returnedTags={"name": ""})
+            return self.client.listCallManagerGroup({**args}, returnedTags=_NAME_TAGS)
         except Fault as e:
             raise AXLFault(e)
 
+    @invalidates_cache("call_manager_group")
     def delete_call_manager_group(self, name):
         """
         Delete call manager group
@@ -4048,6 +4425,7 @@ class Axl(object):
     # ===== SCCP GATEWAYS =====
     ###########################
 
+    @cached("gateway", ttl=30)
     @serialize
     @check_tags("getGateway")
     def get_gateway(self, device_name="", uuid="", *, return_tags=[]):
@@ -4118,6 +4496,7 @@ class Axl(object):
 
         return results
 
+    @invalidates_cache("gateway")
     def add_gateway(
         self,
         mac: str,
@@ -4156,6 +4535,7 @@ class Axl(object):
 
         return self._base_soap_call("addGateway", {"gateway": gateway}, [])
 
+    @invalidates_cache("gateway")
     @check_arguments("addGateway", child="gateway")
     def add_gateway_from_template(
         self, mac: str, description: str, template_name: str, **kwargs
@@ -4227,6 +4607,7 @@ class Axl(object):
     # ===== LINE GROUPS =====
     #########################
 
+    @cached("line_group")
     @serialize
     @check_tags("getLineGroup")
     def get_line_group(self, name: str, *, return_tags=[]) -> dict:
@@ -4263,15 +4644,32 @@ class Axl(object):
                 print(f"[reset {lg_name} devices]: no devices to reset, skipping")
             return None
 
-        device_count: int = 0
-        for line in lg["members"]["member"]:
-            dn = (
+        dns = [
+            (
                 line["directoryNumber"]["pattern"],
                 line["directoryNumber"]["routePartitionName"],
             )
-            line_devices = self.get_directory_number(
-                *dn, return_tags=["associatedDevices"]
-            )["associatedDevices"]
+            for line in lg["members"]["member"]
+        ]
+        # look up every line's devices at once, only the resets need to be staggered
+        try:
+            found_lines = self._multithread(
+                self.get_directory_number,
+                [
+                    {
+                        "pattern": dn[0],
+                        "route_partition": dn[1],
+                        "return_tags": ["associatedDevices"],
+                    }
+                    for dn in dns
+                ],
+            )
+        except MultithreadException as e:
+            raise e.res_exc
+
+        device_count: int = 0
+        for i, (dn, found) in enumerate(zip(dns, found_lines)):
+            line_devices = found["associatedDevices"]
             if line_devices is None:
                 if verbose:
                     print(f"(no devices found for {dn}, skipping...)")
@@ -4280,17 +4678,34 @@ class Axl(object):
                     self.do_device_reset(name=device_name)
                     device_count += 1
             print(f"({dn} complete)")
-            if stagger_timer > 0.0 and line != lg["members"]["member"][-1]:
+            if stagger_timer > 0.0 and i < len(dns) - 1:
                 sleep(stagger_timer)
         if verbose:
             print(f"Line Group '{lg_name}' reset complete")
         return device_count
 
     def do_reset_all_line_groups_devices(self, stagger_timer=1.0) -> None:
+        """Resets the devices on every line of every Line Group, working on several Line Groups at once.
+
+        UCM throttles AXL requests and answers with HTTP 503 once too many are
+        in flight, so only cfg.AXL_PARALLEL Line Groups are reset at the same
+        time (16 by default, set CUCM_PARALLEL to change it). Each of them looks
+        its lines up with up to 8 more requests, all sharing this instance's
+        connection pool.
+
+        Parameters
+        ----------
+        stagger_timer : float, optional
+            Seconds to wait between the lines of a Line Group, by default 1.0
+        """
         lgs = [g["name"] for g in self.list_line_groups(return_tags=["name"])]
 
         print(f"Resetting devices in {len(lgs)} Line Groups...")
-        with ThreadPoolExecutor(max_workers=100) as ex:
+        started = monotonic()
+        throttled: int = 0
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(cfg.AXL_PARALLEL, len(lgs)))
+        ) as ex:
             lg_futs = {
                 ex.submit(
                     self.do_reset_line_group_devices,
@@ -4302,6 +4717,8 @@ class Axl(object):
             }
             for i, f in enumerate(as_completed(lg_futs)):
                 if (exc := f.exception()) is not None:
+                    if isinstance(exc, TransportError) and exc.status_code == 503:
+                        throttled += 1
                     print(
                         f"[{i}/{len(lgs)}] LG '{lg_futs[f]}' raised an exception: {exc}"  # TODO: color this red
                     )
@@ -4310,6 +4727,12 @@ class Axl(object):
                         f"[{i}/{len(lgs)}] Reset '{lg_futs[f]}' with {f.result()} devices."
                     )
 
+        if throttled:
+            print(
+                f"UCM throttled {throttled} Line Group(s) (HTTP 503) within {monotonic() - started:.0f}s,",
+                f"try a lower CUCM_PARALLEL than {cfg.AXL_PARALLEL}.",
+            )
+
     @check_tags("getGatewaySccpEndpoints")
     def tag_test(a="", *, return_tags=[]):
         tags = _tag_handler(return_tags)
@@ -4332,6 +4755,57 @@ class Axl(object):
 # ****************************
 
 
+def _name_or_uuid(name: str, uuid: str, name_key="name") -> Union[dict, None]:
+    """Picks how a request should identify its object. A uuid always wins over a name. Do not use.
+
+    Parameters
+    ----------
+    name : str
+        Name of the object, "" if not given
+    uuid : str
+        uuid of the object, "" if not given
+    name_key : str, optional
+        The AXL argument the name goes in, by default "name"
+
+    Returns
+    -------
+    Union[dict, None]
+        kwargs for the AXL request, or None if neither was given
+    """
+    if uuid != "":
+        return {"uuid": uuid}
+    elif name != "":
+        return {name_key: name}
+    return None
+
+
+@lru_cache(maxsize=None)
+def _key_getter(wanted_keys: tuple) -> Callable:
+    """Builds (once per key path) a function that drills down into a response with the given keys. Do not use.
+
+    Parameters
+    ----------
+    wanted_keys : tuple
+        Keys to drill down into, in order
+
+    Returns
+    -------
+    Callable
+        Takes a response, returns response[key1][key2]...
+    """
+    if len(wanted_keys) == 1:
+        return itemgetter(wanted_keys[0])
+
+    getters = tuple(itemgetter(k) for k in wanted_keys)
+
+    def drill_down(result):
+        for getter in getters:
+            result = getter(result)
+        return result
+
+    return drill_down
+
+
 def _tag_handler(tags: list) -> dict:
     """Internal function for handling basic and complex return tag lists. Do not use.
 
@@ -4345,82 +4819,290 @@ def _tag_handler(tags: list) -> dict:
     dict
         A dict with properly formatted tags for Zeep
     """
-    if tags and type(tags[0]) == dict:
+    if tags and isinstance(tags[0], dict):
         return tags[0]
-    elif all([bool(type(t) == str) for t in tags]):
-        return {t: "" for t in tags}
+    elif all(isinstance(t, str) for t in tags):
+        return _tags_dict(tuple(tags))
 
 
-def _tag_serialize_filter(tags: Union[list, dict], data: dict) -> dict:
-    """[summary]
+@lru_cache(maxsize=128)
+def _tags_dict(tags: tuple) -> dict:
+    """Internal function that builds (and remembers) the Zeep tag dict for a tuple of str tag names. Do not use.
+
+    The returned dict is shared between callers, so it must not be modified.
+    """
+    return {t: "" for t in tags}
+
+
+def _tag_serialize_filter(keep: Union[frozenset, None], data: dict) -> dict:
+    """Unwraps `_value_1` values and drops the None values of tags that weren't asked for. Works on `data` in place, so it must be freshly serialized. Do not use.
 
     Parameters
     ----------
-    tags : Union[list, dict]
-        [description]
+    keep : Union[frozenset, None]
+        The return tags used for the request, from `_tag_keep_set`
     data : dict
-        [description]
+        Serialized response, which is modified
 
     Returns
     -------
     dict
-        [description]
+        The filtered data
     """
 
     def check_value(d: dict) -> dict:
-        d_copy = d.copy()
-        for tag, value in d_copy.items():
-            if type(value) == dict:
-                if "_value_1" in value:
-                    d_copy[tag] = value["_value_1"]
-                else:
-                    d_copy[tag] = check_value(value)
-            elif type(value) == list:
-                for i, d in enumerate(deepcopy(value)):
-                    if type(d) == dict:
-                        value[i] = check_value(d)
-        return d_copy
-
-    working_data = deepcopy(data)
+        for tag, value in d.items():
+            if isinstance(value, dict):
+                d[tag] = (
+                    value["_value_1"] if "_value_1" in value else check_value(value)
+                )
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, dict):
+                        value[i] = check_value(item)
+        return d
+
+    if keep is not None:
+        for tag in [t for t, v in data.items() if v is None and t not in keep]:
+            del data[tag]
     for tag, value in data.items():
-        if tag not in tags and len(tags) > 0 and value is None:
-            working_data.pop(tag, None)
-        elif type(value) == dict:
-            if "_value_1" in value:
-                working_data[tag] = value["_value_1"]
+        if isinstance(value, dict):
+            data[tag] = value["_value_1"] if "_value_1" in value else check_value(value)
+    return data
+
+
+def _serialize_filtered(keep: Union[frozenset, None], obj: CompoundValue) -> dict:
+    """Same result as `_tag_serialize_filter(keep, serialize_object(obj, dict))`, but walks the zeep object only once instead of serializing it and then copying it again to filter it.
+
+    Parameters
+    ----------
+    keep : Union[frozenset, None]
+        The return tags used for the request, from `_tag_keep_set`
+    obj : CompoundValue
+        zeep response object
+
+    Returns
+    -------
+    dict
+        Serialized and filtered data
+    """
+
+    def check_value(d) -> dict:
+        result = {}
+        for tag, value in _fields(d).items():
+            if isinstance(value, (dict, CompoundValue)):
+                fields = _fields(value)
+                if "_value_1" in fields:
+                    result[tag] = serialize_object(fields["_value_1"], dict)
+                else:
+                    result[tag] = check_value(fields)
+            elif isinstance(value, list):
+                result[tag] = [
+                    check_value(v)
+                    if isinstance(v, (dict, CompoundValue))
+                    else serialize_object(v, dict)
+                    for v in value
+                ]
+            else:
+                result[tag] = value
+        return result
+
+    working_data = {}
+    for tag, value in _fields(obj).items():
+        if value is None:
+            if keep is not None and tag not in keep:
+                continue
+            working_data[tag] = None
+        elif isinstance(value, str):
+            working_data[tag] = value
+        elif isinstance(value, (dict, CompoundValue)):
+            fields = _fields(value)
+            if "_value_1" in fields:
+                working_data[tag] = serialize_object(fields["_value_1"], dict)
             else:
-                working_data[tag] = check_value(value)
-        elif type(value) == list:
-            for i, d in enumerate(deepcopy(value)):
-                if type(d) == dict:
-                    value[i] = check_value(d)
+                working_data[tag] = check_value(fields)
+        else:
+            working_data[tag] = serialize_object(value, dict)
     return working_data
 
 
+def _fields(value: Union[dict, CompoundValue]) -> dict:
+    """Returns the dict a zeep CompoundValue keeps its fields in (or the dict itself), skipping CompoundValue's slow attribute/item access. Do not use.
+
+    Parameters
+    ----------
+    value : Union[dict, CompoundValue]
+        zeep response object or dict
+
+    Returns
+    -------
+    dict
+        The fields of the object, which must not be modified
+    """
+    if isinstance(value, CompoundValue):
+        return object.__getattribute__(value, "__values__")
+    return value
+
+
+def _serialize_tags(data, keep: Union[frozenset, None]) -> dict:
+    """Serializes a zeep response and filters it by the given return tags. Do not use.
+
+    Parameters
+    ----------
+    data : Any
+        zeep response object (or already-serialized data)
+    keep : Union[frozenset, None]
+        `_tag_keep_set(tags)`, computed once by the caller
+
+    Returns
+    -------
+    dict
+        Serialized and filtered data
+    """
+    if isinstance(data, CompoundValue):
+        return _serialize_filtered(keep, data)
+    return _tag_serialize_filter(keep, serialize_object(data, dict))
+
+
 def _chunk_data(axl_request: Callable, data_label: str, **kwargs) -> Union[list, Fault]:
+    return list(_iter_chunks(axl_request, data_label, **kwargs))
+
+
+def _iter_chunks(
+    axl_request: Callable, data_label: str, page_size=1000, window=1, **kwargs
+) -> Iterator:
+    """Yields every item from a list* request, asking AXL for `page_size` items at a time. Do not use.
+
+    Parameters
+    ----------
+    axl_request : Callable
+        The zeep list operation, i.e. `self.client.listLine`
+    data_label : str
+        The key the items are found under in the response, i.e. "line"
+    page_size : int, optional
+        Number of items per request, by default 1000
+    window : int, optional
+        Number of pages to request at the same time, by default 1 (one after another, the next page being fetched while the current one is yielded). With more than one (capped at cfg.AXL_PARALLEL), the pages after a full first page are kept `window` at a time in flight, so up to `window - 1` extra (empty) pages may be requested past the end. Only worth it for lists that are usually several pages long.
+
+    Yields
+    ------
+    Iterator
+        Each item returned by AXL, in order, one window of pages in memory at a time
+
+    Raises
+    ------
+    AXLFault
+        The error returned from AXL, if one occured
+    """
+    # never put more pages in flight than bulk operations are allowed requests
+    window = min(window, cfg.AXL_PARALLEL)
+    if window > 1:
+        yield from _iter_chunks_windowed(
+            axl_request, data_label, page_size, window, kwargs
+        )
+        return
+
     skip = 0
-    recv: dict = dict()
-    data: list = []
+    page = _fetch_chunk(axl_request, data_label, page_size, skip, kwargs)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        while True:
+            # a short page means there's nothing left, no need to ask again
+            if len(page) < page_size:
+                yield from page
+                return
+            skip += page_size
+            # fetch the next page while the caller works through this one
+            next_page = ex.submit(
+                _fetch_chunk, axl_request, data_label, page_size, skip, kwargs
+            )
+            yield from page
+            page = next_page.result()
+
+
+def _iter_chunks_windowed(
+    axl_request: Callable, data_label: str, page_size: int, window: int, kwargs: dict
+) -> Iterator:
+    # only fan out once the first page shows there's more than one page to get
+    page = _fetch_chunk(axl_request, data_label, page_size, 0, kwargs)
+    if len(page) < page_size:
+        yield from page
+        return
+
+    with ThreadPoolExecutor(max_workers=window) as ex:
+        # keep `window` pages in flight, asking for the next one as each arrives
+        pending = deque(
+            ex.submit(
+                _fetch_chunk, axl_request, data_label, page_size, i * page_size, kwargs
+            )
+            for i in range(1, window + 1)
+        )
+        skip = (window + 1) * page_size
+        yield from page
+        while True:
+            page = pending.popleft().result()
+            if len(page) < page_size:
+                for extra in pending:
+                    extra.cancel()
+                yield from page
+                return
+            pending.append(
+                ex.submit(
+                    _fetch_chunk, axl_request, data_label, page_size, skip, kwargs
+                )
+            )
+            skip += page_size
+            yield from page
+
+
+def _fetch_chunk(
+    axl_request: Callable, data_label: str, page_size: int, skip: int, kwargs: dict
+) -> list:
+    try:
+        recv = axl_request(**kwargs, first=page_size, skip=skip)["return"]
+    except Fault as e:
+        raise AXLFault(e)
+    if recv is None or data_label not in recv:
+        return []
+    return recv[data_label]
+
+
+def _report_connection_close() -> Callable:
+    """Makes a requests response hook that points out (once) when UCM won't keep connections open. Do not use."""
+    reported = False
+
+    def hook(response, *args, **kwargs):
+        nonlocal reported
+        if not reported and response.headers.get("Connection", "").lower() == "close":
+            reported = True
+            print(
+                f"{colored('[NOTE]', 'yellow')}: {response.url} answered with 'Connection: close', so every AXL request will open a new connection."
+            )
 
-    while recv is not None:
-        try:
-            recv = axl_request(**kwargs, first=1000, skip=skip)["return"]
-        except Fault as e:
-            raise AXLFault(e)
-        if recv is not None:
-            data.extend(recv[data_label])
-            skip += 1000
-    return data
+    return hook
+
+
+def _line_identifier(dn: tuple[str, str]) -> dict:
+    return {"directoryNumber": dn[0], "routePartitionName": dn[1]}
+
+
+_dirn_key = itemgetter("pattern", "routePartitionName")
+
+
+def _lines_to_ids(line_list: Union[dict, None]) -> list[dict]:
+    """Turns the 'lines' of a phone from getPhone into the lineIdentifier list updatePhone expects. Do not use."""
+    return [
+        {
+            "directoryNumber": d["dirn"]["pattern"],
+            "routePartitionName": d["dirn"]["routePartitionName"],
+        }
+        for d in (line_list["line"] if line_list else [])
+    ]
 
 
 def filter_empty_kwargs(all_args: dict, arg_renames: dict = {}) -> dict:
-    args_copy = all_args.copy()
-    for arg, value in all_args.items():
-        if value == "" or arg in ("self", "args", "kwargs"):
-            args_copy.pop(arg)
-        elif arg in arg_renames:
-            args_copy[arg_renames[arg]] = args_copy.pop(arg)
-
-        if value == Empty:
-            args_copy[arg] = ""
-    return args_copy
+    # one pass over the locals, no copying and popping
+    return {
+        arg_renames.get(arg, arg): "" if value is Empty else value
+        for arg, value in all_args.items()
+        if value != "" and arg not in ("self", "args", "kwargs")
+    }
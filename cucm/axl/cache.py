@@ -0,0 +1,213 @@
+import sqlite3
+import threading
+import cucm.axl.configs as cfg
+from time import monotonic
+from datetime import datetime, timezone
+from pathlib import Path
+from contextlib import contextmanager
+from zeep.cache import SqliteCache
+from zeep.settings import Settings
+from zeep.transports import Transport
+from zeep.wsdl import Document
+
+
+class TunedSqliteCache(SqliteCache):
+    """zeep SqliteCache with read-mostly pragmas and an in-process layer in front of it.
+
+    Once warmed up the WSDL/XSD cache is only ever read, so hits are served from
+    a dict without touching the database, and the connections zeep opens for
+    misses skip fsyncs and keep their pages in memory.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=OFF;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA mmap_size=268435456;"
+    )
+
+    def __init__(self, path=None, timeout=3600):
+        self._memory: dict[str, tuple[float, bytes]] = {}
+        self._memory_lock = threading.Lock()
+        super().__init__(path=path, timeout=timeout)
+
+    @contextmanager
+    def db_connection(self):
+        with self._lock:
+            connection = sqlite3.connect(
+                self._db_path, detect_types=sqlite3.PARSE_DECLTYPES
+            )
+            connection.executescript(self.PRAGMAS)
+            yield connection
+            connection.close()
+
+    def add(self, url, content):
+        super().add(url, content)
+        with self._memory_lock:
+            self._memory[url] = (monotonic(), content)
+
+    def get(self, url):
+        if (entry := self._memory.get(url, None)) is not None:
+            created, content = entry
+            if self._timeout is None or monotonic() - created < self._timeout:
+                return content
+
+        with self.db_connection() as connection:
+            rows = connection.execute(
+                "SELECT created, content FROM request WHERE url=?", (url,)
+            ).fetchall()
+        if not rows:
+            return None
+
+        # an entry's age counts from when it was written, not from when it was loaded
+        written, data = rows[0]
+        age = (
+            datetime.now(timezone.utc) - written.replace(tzinfo=timezone.utc)
+        ).total_seconds()
+        if self._timeout is not None and age >= self._timeout:
+            return None
+
+        content = self._decode_data(data)
+        if content is not None:
+            with self._memory_lock:
+                self._memory[url] = (monotonic() - age, content)
+        return content
+
+
+_shared_cache: TunedSqliteCache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> TunedSqliteCache:
+    """Returns the process-wide WSDL cache so every Axl instance shares the same warm entries
+
+    Returns
+    -------
+    TunedSqliteCache
+        The shared cache
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                path = None
+                if cfg.WSDL_CACHE_PATH is not None:
+                    # zeep only creates its own default cache dir, not a configured one
+                    path = Path(cfg.WSDL_CACHE_PATH).expanduser()
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path = str(path)
+                _shared_cache = TunedSqliteCache(path=path, timeout=cfg.WSDL_CACHE_TTL)
+    return _shared_cache
+
+
+_wsdl_documents: dict[str, Document] = {}
+_wsdl_documents_lock = threading.Lock()
+
+
+def get_wsdl_document(wsdl: str, settings: Settings) -> Document:
+    """Returns the parsed WSDL document for the given path, parsing it only the first time it's requested.
+
+    The document is loaded with its own credential-less transport, so it can be
+    shared between Axl instances that each bring their own authenticated Client.
+
+    Parameters
+    ----------
+    wsdl : str
+        Path to the AXLAPI.wsdl file
+    settings : Settings
+        zeep settings used to parse the document
+
+    Returns
+    -------
+    Document
+        The (shared) parsed WSDL
+    """
+    if (document := _wsdl_documents.get(wsdl, None)) is not None:
+        return document
+
+    with _wsdl_documents_lock:
+        if (document := _wsdl_documents.get(wsdl, None)) is None:
+            document = _wsdl_documents[wsdl] = Document(
+                wsdl,
+                Transport(timeout=10, cache=get_shared_cache()),
+                settings=settings,
+            )
+    return document
+
+
+def freeze(value):
+    """Turns nested lists/dicts (i.e. kwargs or return_tags) into hashable tuples so they can be used as cache keys.
+
+    Parameters
+    ----------
+    value : Any
+        Value to freeze
+
+    Returns
+    -------
+    Any
+        Hashable version of the value
+    """
+    # the container type is kept in the key, so i.e. ["a"] and ("a",) don't collide
+    if isinstance(value, dict):
+        return (dict, tuple((k, freeze(v)) for k, v in sorted(value.items())))
+    elif isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(v) for v in value))
+    elif isinstance(value, (set, frozenset)):
+        # sets have no order to rely on, so they stay sets
+        return (frozenset, frozenset(freeze(v) for v in value))
+    return value
+
+
+class ResultCache:
+    """Thread-safe TTL cache for AXL read results, split into categories so that
+    a write to one kind of object (i.e. a region) only throws away lookups of that kind.
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[str, dict[tuple, tuple[float, object]]] = {}
+        # bumped on every invalidate, so reads that started before one can tell
+        self._generations: dict[str, int] = {}
+        self._clears: int = 0
+        self._lock = threading.Lock()
+
+    def generation(self, category: str) -> tuple:
+        return (self._clears, self._generations.get(category, 0))
+
+    def get(self, category: str, key: tuple, default=None):
+        entries = self._entries.get(category, None)
+        if entries is None or (entry := entries.get(key, None)) is None:
+            return default
+
+        expires, value = entry
+        if monotonic() >= expires:
+            with self._lock:
+                entries.pop(key, None)
+            return default
+        return value
+
+    def put(
+        self, category: str, key: tuple, value, ttl: float = None, generation=None
+    ) -> None:
+        expires = monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            # the category was invalidated while the value was being fetched
+            if generation is not None and generation != self.generation(category):
+                return
+            entries = self._entries.setdefault(category, {})
+            entries[key] = (expires, value)
+            while len(entries) > self.maxsize:
+                # dicts keep insertion order, so the first entry is the oldest
+                entries.pop(next(iter(entries)))
+
+    def invalidate(self, *categories: str) -> None:
+        with self._lock:
+            if not categories:
+                self._entries.clear()
+                self._clears += 1
+            for category in categories:
+                self._entries.pop(category, None)
+                self._generations[category] = self._generations.get(category, 0) + 1
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from zeep.exceptions import Fault
 
@@ -8,9 +9,29 @@ USERNAME_MAGIC_KEY: str = "73q0eWFaIE2JJw8FMNeX"
 URL_MAGIC_KEY: str = "8Cu16DGzNvunSsDNOTrO"
 DUMMY_KEY: str = "xlGoVnofkKjNSgnwA9Z7"
 
+# sized to cover the ThreadPoolExecutor used by Axl._multithread
+AXL_POOL_SIZE: int = 128
+
+# how many line groups (etc.) bulk operations work on at once, lower it with
+# CUCM_PARALLEL if UCM starts answering with HTTP 503 (AXL throttling)
+AXL_PARALLEL: int = int(os.environ.get("CUCM_PARALLEL", "16"))
+
+# Methods decorated while one of these is already set skip the wrapper entirely.
+# Flipping them later (i.e. with turn_off_tags_checker()) still takes effect,
+# since the wrappers also check them on every call.
 DISABLE_SERIALIZER = False
 DISABLE_CHECK_TAGS = False
 DISABLE_CHECK_ARGS = False
+DISABLE_CACHE = False
+
+# seconds that results from @cached Axl methods are reused for
+CACHE_TTL: int = 60
+
+# on-disk cache for the schemas that zeep fetches while loading the WSDL,
+# shared by every Axl instance (None lets zeep pick its per-user cache dir).
+# The schemas are bundled per UCM version, so entries don't go stale within a day.
+WSDL_CACHE_PATH: str = None
+WSDL_CACHE_TTL: int = 86400
 
 
 # def turn_off_serializer() -> None:
@@ -26,3 +47,8 @@ def turn_off_tags_checker() -> None:
 def turn_off_args_checker() -> None:
     global DISABLE_CHECK_ARGS
     DISABLE_CHECK_ARGS = True
+
+
+def turn_off_cache() -> None:
+    global DISABLE_CACHE
+    DISABLE_CACHE = True
@@ -28,13 +28,14 @@ def validate_ucm_server(url: str, port="8443") -> bool:
     if not validators.url(fullurl):
         raise URLInvalidError(fullurl)
 
-    status = get_url_status_code(fullurl, timeout=10)
+    # one request for both the status and the page, instead of fetching it twice
+    recv = get_url_response(fullurl, timeout=10)
+    status = recv if isinstance(recv, int) else recv.status_code
     if status == 200:
-        with session_standard() as s:
-            if not BeautifulSoup(s.get(fullurl, timeout=10).text, "html.parser").find(
-                string="Cisco Unified Communications Manager"
-            ):
-                raise UCMInvalidError(fullurl)
+        if not BeautifulSoup(recv.text, "html.parser").find(
+            string="Cisco Unified Communications Manager"
+        ):
+            raise UCMInvalidError(fullurl)
         return True
     elif status == -1:
         raise UCMNotFoundError(fullurl)
@@ -1,4 +1,6 @@
 from typing import Union
+from threading import Lock
+from weakref import WeakKeyDictionary
 from zeep import Client
 from zeep.xsd.elements.element import Element
 from zeep.xsd.elements.indicators import Choice, Sequence
@@ -202,7 +204,13 @@ class AXLElement:
                 f"A non-named argument was supplied for {self.name} with the value {args[0]}. Arguments for AXL API requests must all be named (kwargs)."
             )
 
-        c_dict = self.children_dict(required=True)
+        # trees from get_tree() are shared and never modified, so this only needs building once
+        if (c_dict := getattr(self, "_required_children", None)) is None:
+            c_dict = self._required_children = self.children_dict(required=True)
+            # children that take a plain value, for the fast path below
+            self._value_children = frozenset(
+                name for name, value in c_dict.items() if type(value) != dict
+            )
         if self.type == Choice:
             groups: list[list[str]] = [
                 [e.name for e in c.children]
@@ -219,6 +227,11 @@ class AXLElement:
                     arguments=elements + groups,
                     element_name=self.parent._parent_chain(),
                 )
+        elif kwargs.keys() <= self._value_children and all(
+            type(value) not in (dict, list) for value in kwargs.values()
+        ):
+            # only known tag-value pairs, nothing else to check
+            return None
         else:
             for name, value in kwargs.items():
                 if type(value) not in (dict, list):  # * normal tag-value pairs
@@ -389,6 +402,19 @@ class AXLElement:
                 return self.children[0]
 
 
+# parsed element trees and tag lists, per WSDL document (shared between Axl instances)
+_documents_cache: WeakKeyDictionary = WeakKeyDictionary()
+_documents_cache_lock = Lock()
+
+
+def _wsdl_cache(z_client: Client) -> dict:
+    try:
+        return _documents_cache[z_client.wsdl]
+    except KeyError:
+        with _documents_cache_lock:
+            return _documents_cache.setdefault(z_client.wsdl, {})
+
+
 def __get_element_by_name(z_client: Client, element_name: str) -> Element:
     try:
         element = z_client.get_element(f"ns0:{element_name}")
@@ -445,6 +471,10 @@ def get_search_criteria(z_client: Client, element_name: str) -> list[str]:
 
 
 def get_return_tags(z_client: Client, element_name: str) -> list[str]:
+    cache = _wsdl_cache(z_client)
+    if (tags := cache.get(("tags", element_name), None)) is not None:
+        return list(tags)
+
     try:
         return_tree = get_tree(z_client, element_name)["returnedTags"]
     except KeyError:
@@ -466,7 +496,8 @@ def get_return_tags(z_client: Client, element_name: str) -> list[str]:
                 tags.append(child.name)
         return tags
 
-    return extract_return_tags(return_tree)
+    tags = cache[("tags", element_name)] = extract_return_tags(return_tree)
+    return list(tags)
 
     # return __get_element_child_args(z_client, element_name, child_name="returnedTags")
 
@@ -480,7 +511,21 @@ def get_return_tree(z_client: Client, element_name: str) -> dict:
 
 
 def get_tree(z_client: Client, element_name: str) -> AXLElement:
-    return AXLElement(__get_element_by_name(z_client, element_name))
+    # trees are only read after being built, so one per element is plenty
+    cache = _wsdl_cache(z_client)
+    if (tree := cache.get(("tree", element_name), None)) is None:
+        tree = cache[("tree", element_name)] = AXLElement(
+            __get_element_by_name(z_client, element_name)
+        )
+    return tree
+
+
+def get_type_factory(z_client: Client, type_name: str):
+    # resolving a type walks the schema, so each one is only looked up once per document
+    cache = _wsdl_cache(z_client)
+    if (factory := cache.get(("type", type_name), None)) is None:
+        factory = cache[("type", type_name)] = z_client.get_type(f"ns0:{type_name}")
+    return factory
 
 
 # def fix_return_tags(z_client: Client, element_name: str, tags: list[str]) -> list:
@@ -512,6 +557,14 @@ def get_tree(z_client: Client, element_name: str) -> AXLElement:
 
 
 def fix_return_tags(z_client: Client, element_name: str, tags: list[str]) -> list:
+    try:
+        key = ("fixed", element_name, tuple(tags))
+        cached = _wsdl_cache(z_client).get(key, None)
+    except TypeError:  # unhashable tags, don't bother caching
+        key, cached = None, None
+    if cached is not None:
+        return [dict(cached)]
+
     tree = get_tree(z_client, element_name)
 
     if tree.get("returnedTags", None) is None:
@@ -546,7 +599,20 @@ def fix_return_tags(z_client: Client, element_name: str, tags: list[str]) -> lis
         else:
             raise TagNotValid(tag, tag_tree.children_names(), elem_name=element_name)
 
-    return [return_tags]
+    if key is not None:
+        _wsdl_cache(z_client)[key] = return_tags
+    return [dict(return_tags)]
+
+
+def fix_all_return_tags(z_client: Client, element_name: str) -> list:
+    # same as fix_return_tags(..., get_return_tags(...)), without copying and
+    # hashing the full tag list every time an empty return_tags is given
+    cache = _wsdl_cache(z_client)
+    if (cached := cache.get(("fixed_all", element_name), None)) is None:
+        cached = cache[("fixed_all", element_name)] = fix_return_tags(
+            z_client, element_name, get_return_tags(z_client, element_name)
+        )[0]
+    return [dict(cached)]
 
 
 def validate_soap_arguments(z_client: Client, element_name: str, **kwargs) -> bool:
@@ -558,7 +624,7 @@ def validate_soap_arguments(z_client: Client, element_name: str, **kwargs) -> bo
 def print_element_layout(
     z_client: Client, element_name: str, show_required=False, show_types=False
 ) -> None:
-    root: AXLElement = AXLElement(__get_element_by_name(z_client, element_name))
+    root: AXLElement = get_tree(z_client, element_name)
     root.print_tree(show_required=show_required, show_types=show_types)
 
 
@@ -572,7 +638,7 @@ def print_required_element_layout(
 def print_return_tags_layout(
     z_client: Client, element_name: str, show_required=False, show_types=False
 ) -> None:
-    root: AXLElement = AXLElement(__get_element_by_name(z_client, element_name))
+    root: AXLElement = get_tree(z_client, element_name)
     if (r_tags := root.find("returnedTags")) is None:
         raise WSDLException(
             f"'returnedTags' element cannot be found within '{element_name}'"
@@ -587,10 +653,13 @@ def validate_arguments(
     if not kwargs:
         return None
 
-    root: AXLElement = AXLElement(__get_element_by_name(z_client, element_name))
-    if (
-        child is not None
-    ):  # if the child needs to be the reference point instead of root node
-        root = root.get(child)
+    if child is None:
+        root: AXLElement = get_tree(z_client, element_name)
+    else:  # if the child needs to be the reference point instead of root node
+        cache = _wsdl_cache(z_client)
+        if (root := cache.get(("tree", element_name, child), None)) is None:
+            root = cache[("tree", element_name, child)] = get_tree(
+                z_client, element_name
+            ).get(child)
 
     root.validate(**kwargs)
@@ -8,6 +8,7 @@ from requests.adapters import (
 from requests.auth import HTTPBasicAuth
 from urllib.parse import urlparse
 from urllib3.util.retry import Retry
+from typing import Union
 import tldextract
 
 
@@ -77,4 +78,35 @@ def get_url_status_code(url: str, username="", password="", timeout=10) -> int:
     except (ConnectionError, MaxRetryError, TimeoutError):
         return -1
     except ConnectTimeout:
-        return 0
\ No newline at end of file
+        return 0
+
+
+def get_url_response(
+    url: str, username="", password="", timeout=10
+) -> Union[requests.Response, int]:
+    """Same as get_url_status_code, but returns the whole response so that
+    callers who also need the body don't have to request the page twice.
+
+    Args:
+        url (str): Address to send request to
+        username (str, optional): HTTP auth username. Defaults to "".
+        password (str, optional): HTTP auth password. Defaults to "".
+        timeout (int, optional): Time until request gives up. Defaults to 10.
+
+    Returns:
+        Union[requests.Response, int]: If cannot connect, returns -1.
+            If timeout occurs, returns 0.
+            Otherwise, returns the response
+    """
+    if any((username, password)):
+        sesh = session_auth(username, password)
+    else:
+        sesh = session_standard()
+
+    try:
+        with sesh as s:
+            return s.get(url, timeout=timeout)
+    except (ConnectionError, MaxRetryError, TimeoutError):
+        return -1
+    except ConnectTimeout:
+        return 0
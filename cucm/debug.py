@@ -14,9 +14,15 @@ from cucm.axl.exceptions import (
     AXLClassException,
     WSDLException,
 )
-from cucm.axl.wsdl import print_element_layout, fix_return_tags, get_return_tags
+from cucm.axl.wsdl import (
+    print_element_layout,
+    fix_return_tags,
+    get_return_tags,
+    get_tree,
+)
+from concurrent.futures import ThreadPoolExecutor
 import keyring
-import sys, os
+import sys, os, shutil
 
 
 VALIDATION_EXCEPTIONS = (
@@ -33,7 +39,7 @@ VALIDATION_EXCEPTIONS = (
 )
 
 
-def set_url_and_port() -> Axl:
+def set_url_and_port(use_stored_version=False) -> Axl:
     valid_ucm = None
     while valid_ucm is None:
         if not (weburl := keyring.get_password("cucm-py", "webaddr")):
@@ -51,12 +57,21 @@ def set_url_and_port() -> Axl:
                 )
                 keyring.set_password("cucm-py", "webaddr", new_weburl)
                 keyring.set_password("cucm-py", "port", port)
+                keyring.set_password("cucm-py", "version", valid_ucm.cucm_version)
             except VALIDATION_EXCEPTIONS as e:
                 print(f"\nThat URL didn't work ({e.__name__})...please try again.")
         else:
             port = keyring.get_password("cucm-py", "port")
+            # the schema tools don't need to ask UCM for a version it already told us
+            version = ""
+            if use_stored_version:
+                version = keyring.get_password("cucm-py", "version") or ""
             try:
-                valid_ucm = Axl(*get_credentials(), cucm=weburl, port=port)
+                valid_ucm = Axl(
+                    *get_credentials(), cucm=weburl, port=port, version=version
+                )
+                if not version:
+                    keyring.set_password("cucm-py", "version", valid_ucm.cucm_version)
             except VALIDATION_EXCEPTIONS as e:
                 if (
                     input(
@@ -66,6 +81,7 @@ def set_url_and_port() -> Axl:
                 ):
                     keyring.set_password("cucm-py", "webaddr", "")
                     keyring.set_password("cucm-py", "port", "")
+                    keyring.set_password("cucm-py", "version", "")
                     continue
                 else:
                     raise Exception("Could not connect to UCM AXL service")
@@ -83,6 +99,7 @@ def get_url_and_port() -> tuple[str, str]:
 def clear_url_and_port() -> None:
     keyring.set_password("cucm-py", "webaddr", "")
     keyring.set_password("cucm-py", "port", "")
+    keyring.set_password("cucm-py", "version", "")
     print("URL and port cleared")
 
 
@@ -91,27 +108,46 @@ def axl_connect() -> None:
     print(ucm.cucm, f"v{ucm.cucm_version}")
 
 
+def _warm_axl_tree(ucm: Axl, method: str) -> None:
+    # errors are left for print_axl_arguments to report
+    if element_name := getattr(getattr(ucm, method, None), "element_name", None):
+        try:
+            get_tree(ucm.zeep, element_name)
+        except WSDLException:
+            pass
+
+
 def print_axl_tree() -> None:
-    ucm = set_url_and_port()
+    ucm = set_url_and_port(use_stored_version=True)
     if len(sys.argv) < 2:
         print(
             "USAGE: poetry run show_tree [AXL_METHOD] [AXL_METHOD_2] [AXL_METHOD_3] ..."
         )
     else:
-        for n, method in enumerate(sys.argv[1:]):
-            if n > 0:
-                input("\nPress [enter] to continue or [ctrl + c] to stop.")
-                print("\n", "=" * (os.get_terminal_size().columns - 1), sep="")
-
-            try:
-                print("")  # newline
-                ucm.print_axl_arguments(method)
-            except AXLClassException as e:
-                print(f"[ERROR]({method}): {e.__str__}")
+        width = shutil.get_terminal_size().columns - 1
+        methods = sys.argv[1:]
+        # build the trees in the background while the user reads the previous one
+        ex = ThreadPoolExecutor(max_workers=1)
+        warmed = [ex.submit(_warm_axl_tree, ucm, method) for method in methods]
+        try:
+            for n, (method, ready) in enumerate(zip(methods, warmed)):
+                if n > 0:
+                    input("\nPress [enter] to continue or [ctrl + c] to stop.")
+                    print("\n", "=" * width, sep="")
+
+                ready.result()
+                try:
+                    print("")  # newline
+                    ucm.print_axl_arguments(method)
+                except AXLClassException as e:
+                    print(f"[ERROR]({method}): {e.__str__}")
+        finally:
+            # don't make a ctrl + c wait on trees nobody is going to look at
+            ex.shutdown(wait=False, cancel_futures=True)
 
 
 def print_soap_tree() -> None:
-    ucm = set_url_and_port()
+    ucm = set_url_and_port(use_stored_version=True)
     if len(sys.argv) < 2:
         print(
             "USAGE: poetry run show_tree [AXL_METHOD] [AXL_METHOD_2] [AXL_METHOD_3] ..."
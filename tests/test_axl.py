@@ -67,3 +67,8 @@ class TestAPI:
         result = self.ucm.get_ldap_dir(return_tags=[])
         assert result[0]["name"] == "cuid"
         assert result[0].get("scheduleUnit", None) == "DAY"
+
+    def test_cached_results_are_copies(self):
+        first = self.ucm.get_locations()
+        first[0]["name"] = "changed by test"
+        assert self.ucm.get_locations()[0]["name"] != "changed by test"
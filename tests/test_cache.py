@@ -0,0 +1,213 @@
+import sqlite3
+import pytest
+from datetime import datetime, timedelta, timezone
+from cucm.axl import cache
+from cucm.axl.axl import cached, invalidates_cache
+from cucm.axl.cache import ResultCache, TunedSqliteCache, freeze
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "monotonic", fake)
+    return fake
+
+
+class TestFreeze:
+    def test_is_hashable(self):
+        frozen = freeze({"name": "SEP1", "tags": ["name", {"lines": ""}], "ids": {1}})
+        assert hash(frozen) == hash(
+            freeze({"ids": {1}, "tags": ["name", {"lines": ""}], "name": "SEP1"})
+        )
+
+    def test_dict_order_does_not_matter(self):
+        assert freeze({"a": 1, "b": 2}) == freeze({"b": 2, "a": 1})
+
+    def test_list_and_tuple_differ(self):
+        assert freeze(["a", "b"]) != freeze(("a", "b"))
+
+    def test_dict_and_pairs_differ(self):
+        assert freeze({"a": 1}) != freeze((("a", 1),))
+
+    def test_set_order_does_not_matter(self):
+        assert freeze({"a", "b", "c"}) == freeze({"c", "b", "a"})
+        assert freeze({"a", "b"}) == freeze(frozenset({"b", "a"}))
+
+    def test_scalars_are_unchanged(self):
+        assert freeze("SEP1") == "SEP1"
+        assert freeze(None) is None
+
+
+class TestResultCache:
+    def test_get_missing(self):
+        results = ResultCache()
+        assert results.get("phone", ("k",)) is None
+        assert results.get("phone", ("k",), "default") == "default"
+
+    def test_put_and_get(self):
+        results = ResultCache()
+        results.put("phone", ("k",), "value")
+        assert results.get("phone", ("k",)) == "value"
+        assert results.get("line", ("k",)) is None
+
+    def test_ttl(self, clock):
+        results = ResultCache(ttl=60)
+        results.put("phone", ("k",), "value")
+        results.put("phone", ("short",), "value", ttl=5)
+
+        clock.now += 5
+        assert results.get("phone", ("k",)) == "value"
+        assert results.get("phone", ("short",)) is None
+
+        clock.now += 55
+        assert results.get("phone", ("k",)) is None
+
+    def test_oldest_entries_are_evicted(self):
+        results = ResultCache(maxsize=2)
+        for n in range(3):
+            results.put("phone", (n,), n)
+        assert results.get("phone", (0,)) is None
+        assert results.get("phone", (1,)) == 1
+        assert results.get("phone", (2,)) == 2
+
+    def test_maxsize_is_per_category(self):
+        results = ResultCache(maxsize=1)
+        results.put("phone", ("k",), "phone")
+        results.put("line", ("k",), "line")
+        assert results.get("phone", ("k",)) == "phone"
+        assert results.get("line", ("k",)) == "line"
+
+    def test_invalidate_categories(self):
+        results = ResultCache()
+        results.put("phone", ("k",), "phone")
+        results.put("line", ("k",), "line")
+        results.put("region", ("k",), "region")
+
+        results.invalidate("phone", "line")
+        assert results.get("phone", ("k",)) is None
+        assert results.get("line", ("k",)) is None
+        assert results.get("region", ("k",)) == "region"
+
+    def test_invalidate_everything(self):
+        results = ResultCache()
+        results.put("phone", ("k",), "phone")
+        results.put("line", ("k",), "line")
+
+        results.invalidate()
+        assert results.get("phone", ("k",)) is None
+        assert results.get("line", ("k",)) is None
+
+    def test_put_after_invalidate_is_dropped(self):
+        results = ResultCache()
+        generation = results.generation("phone")
+        results.invalidate("phone")
+        results.put("phone", ("k",), "stale", generation=generation)
+        assert results.get("phone", ("k",)) is None
+
+        generation = results.generation("phone")
+        results.invalidate()
+        results.put("phone", ("k",), "stale", generation=generation)
+        assert results.get("phone", ("k",)) is None
+
+    def test_put_after_other_invalidate_is_kept(self):
+        results = ResultCache()
+        generation = results.generation("phone")
+        results.invalidate("line")
+        results.put("phone", ("k",), "value", generation=generation)
+        assert results.get("phone", ("k",)) == "value"
+
+
+def backdate(path, url: str, seconds: float) -> None:
+    written = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE request SET created=? WHERE url=?", (written, url))
+
+
+class TestTunedSqliteCache:
+    URL = "http://schemas.example.com/soap.xsd"
+
+    def test_memory_hit(self, tmp_path):
+        wsdl_cache = TunedSqliteCache(path=str(tmp_path / "cache.db"), timeout=100)
+        wsdl_cache.add(self.URL, b"schema")
+        assert wsdl_cache.get(self.URL) == b"schema"
+        assert wsdl_cache.get("http://other.example.com") is None
+
+    def test_loaded_entry_keeps_its_age(self, tmp_path, clock):
+        path = str(tmp_path / "cache.db")
+        TunedSqliteCache(path=path, timeout=100).add(self.URL, b"schema")
+        backdate(path, self.URL, 90)
+
+        wsdl_cache = TunedSqliteCache(path=path, timeout=100)
+        assert wsdl_cache.get(self.URL) == b"schema"
+        created, _ = wsdl_cache._memory[self.URL]
+        assert clock.now - created >= 90
+
+    def test_expired_entry_is_not_loaded(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        TunedSqliteCache(path=path, timeout=100).add(self.URL, b"schema")
+        backdate(path, self.URL, 110)
+
+        wsdl_cache = TunedSqliteCache(path=path, timeout=100)
+        assert wsdl_cache.get(self.URL) is None
+        assert self.URL not in wsdl_cache._memory
+
+
+class FakeAxl:
+    def __init__(self) -> None:
+        self._cache = ResultCache()
+        self.reads = 0
+        self.write_during_read = False
+
+    @cached("phone")
+    def get_phone(self, name: str) -> dict:
+        self.reads += 1
+        if self.write_during_read:
+            self.write_during_read = False
+            self.update_phone(name)
+        return {"name": name, "lines": ["1000"]}
+
+    @invalidates_cache("phone")
+    def update_phone(self, name: str) -> None:
+        pass
+
+
+class TestCachedDecorator:
+    def test_results_are_reused(self):
+        ucm = FakeAxl()
+        ucm.get_phone("SEP1")
+        ucm.get_phone("SEP1")
+        ucm.get_phone("SEP2")
+        assert ucm.reads == 2
+
+    def test_results_are_copies(self):
+        ucm = FakeAxl()
+        ucm.get_phone("SEP1")["lines"].append("2000")
+        assert ucm.get_phone("SEP1")["lines"] == ["1000"]
+
+    def test_writes_invalidate(self):
+        ucm = FakeAxl()
+        ucm.get_phone("SEP1")
+        ucm.update_phone("SEP1")
+        ucm.get_phone("SEP1")
+        assert ucm.reads == 2
+
+    def test_read_racing_a_write_is_not_kept(self):
+        ucm = FakeAxl()
+        ucm.write_during_read = True
+        ucm.get_phone("SEP1")
+        ucm.get_phone("SEP1")
+        assert ucm.reads == 2
+
+    def test_unfreezable_arguments_are_not_cached(self):
+        ucm = FakeAxl()
+        ucm.get_phone({1: "SEP1", "name": "SEP1"})
+        ucm.get_phone({1: "SEP1", "name": "SEP1"})
+        assert ucm.reads == 2
@@ -0,0 +1,82 @@
+import threading
+import time
+import pytest
+from zeep.exceptions import Fault
+from cucm.axl.axl import _chunk_data, _iter_chunks
+from cucm.axl.exceptions import AXLFault
+
+
+class FakeList:
+    def __init__(self, total: int, fault_at: int = None, slow_first: bool = False):
+        self.total = total
+        self.fault_at = fault_at
+        self.slow_first = slow_first
+        self.skips = []
+        self._lock = threading.Lock()
+
+    def __call__(self, first: int, skip: int, **kwargs) -> dict:
+        with self._lock:
+            self.skips.append(skip)
+        if self.fault_at is not None and skip >= self.fault_at:
+            raise Fault("Item not valid: The specified page does not exist")
+        if self.slow_first:
+            # earlier pages finish after later ones
+            time.sleep(max(0, 0.05 - skip / 1000))
+        rows = list(range(skip, min(skip + first, self.total)))
+        return {"return": {"row": rows} if rows else None}
+
+
+class TestChunkData:
+    def test_empty(self):
+        axl_request = FakeList(0)
+        assert _chunk_data(axl_request, "row", page_size=10) == []
+        assert axl_request.skips == [0]
+
+    def test_missing_label(self):
+        assert _chunk_data(lambda **kw: {"return": {}}, "row", page_size=10) == []
+
+    def test_short_last_page(self):
+        axl_request = FakeList(25)
+        assert _chunk_data(axl_request, "row", page_size=10) == list(range(25))
+        assert axl_request.skips == [0, 10, 20]
+
+    def test_exact_multiple_of_page_size(self):
+        axl_request = FakeList(30)
+        assert _chunk_data(axl_request, "row", page_size=10) == list(range(30))
+        # the only way to know the last full page was the last one is to ask again
+        assert axl_request.skips == [0, 10, 20, 30]
+
+    def test_single_short_page_is_not_windowed(self):
+        axl_request = FakeList(5)
+        assert _chunk_data(axl_request, "row", page_size=10, window=4) == list(range(5))
+        assert axl_request.skips == [0]
+
+    @pytest.mark.parametrize("total", [10, 25, 30, 95, 100])
+    def test_window_keeps_order(self, total):
+        axl_request = FakeList(total, slow_first=True)
+        assert _chunk_data(axl_request, "row", page_size=10, window=4) == list(
+            range(total)
+        )
+        assert set(range(0, total + 1, 10)) <= set(axl_request.skips)
+
+    def test_kwargs_are_passed_on(self):
+        seen = []
+
+        def axl_request(first, skip, **kwargs):
+            seen.append(kwargs)
+            return {"return": None}
+
+        _chunk_data(axl_request, "row", searchCriteria={"name": "%"})
+        assert seen == [{"searchCriteria": {"name": "%"}}]
+
+    @pytest.mark.parametrize("window", [1, 4])
+    def test_fault_on_later_page(self, window):
+        axl_request = FakeList(100, fault_at=30)
+        with pytest.raises(AXLFault):
+            _chunk_data(axl_request, "row", page_size=10, window=window)
+
+    def test_fault_after_yielded_pages(self):
+        rows = _iter_chunks(FakeList(100, fault_at=20), "row", page_size=10)
+        assert [next(rows) for _ in range(20)] == list(range(20))
+        with pytest.raises(AXLFault):
+            next(rows)
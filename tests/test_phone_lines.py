@@ -0,0 +1,136 @@
+import pytest
+from cucm.axl.axl import Axl
+from cucm.axl.cache import ResultCache
+from cucm.axl.exceptions import InvalidArguments
+
+
+class StubClient:
+    def __init__(self) -> None:
+        self.updates = []
+
+    def updatePhone(self, **kwargs) -> None:
+        self.updates.append(kwargs)
+
+
+class StubAxl(Axl):
+    """An Axl that never connects, with a single phone whose lines are `dns`."""
+
+    def __init__(self, dns: list[tuple[str, str]]) -> None:
+        self._cache = ResultCache()
+        self.client = StubClient()
+        self.lines = [
+            {"index": i, "dirn": {"pattern": dn[0], "routePartitionName": dn[1]}}
+            for i, dn in enumerate(dns, start=1)
+        ]
+        self.looked_up = []
+
+    def get_phone(self, name: str, return_tags: list = []) -> dict:
+        return {"name": name, "lines": {"line": self.lines} if self.lines else None}
+
+    def get_directory_number(
+        self, pattern: str, route_partition: str, return_tags: list = []
+    ) -> dict:
+        self.looked_up.append((pattern, route_partition))
+        return {"pattern": pattern}
+
+    @property
+    def sent(self) -> dict:
+        (update,) = self.client.updates
+        return update["lines"]
+
+
+def ids(*patterns: str) -> dict:
+    return {
+        "lineIdentifier": [
+            {"directoryNumber": p, "routePartitionName": "PT"} for p in patterns
+        ]
+    }
+
+
+DNS = [("1000", "PT"), ("2000", "PT"), ("3000", "PT")]
+
+
+class TestSetPhoneLines:
+    def test_appends_by_default(self):
+        ucm = StubAxl(DNS[:1])
+        ucm.set_phone_lines("SEP1", DNS[1:])
+        assert ucm.sent == ids("1000", "2000", "3000")
+        assert sorted(ucm.looked_up) == DNS[1:]
+
+    def test_position_splices(self):
+        ucm = StubAxl(DNS[:2])
+        ucm.set_phone_lines("SEP1", [("4000", "PT"), ("5000", "PT")], position=2)
+        assert ucm.sent == ids("1000", "4000", "5000", "2000")
+
+    def test_first_position(self):
+        ucm = StubAxl(DNS[:2])
+        ucm.set_phone_lines("SEP1", [("4000", "PT")], position=1)
+        assert ucm.sent == ids("4000", "1000", "2000")
+
+    def test_replace(self):
+        ucm = StubAxl(DNS)
+        ucm.set_phone_lines("SEP1", [("4000", "PT")], replace=True, validate=False)
+        assert ucm.sent == ids("4000")
+        assert ucm.looked_up == []
+
+    def test_no_lines_left(self):
+        ucm = StubAxl([])
+        with pytest.raises(InvalidArguments):
+            ucm.set_phone_lines("SEP1", [], replace=True)
+        assert ucm.client.updates == []
+
+    def test_add_phone_line_replace(self):
+        ucm = StubAxl(DNS)
+        ucm.add_phone_line("SEP1", ("4000", "PT"), replace=True)
+        assert ucm.sent == ids("4000")
+
+
+class TestRemovePhoneLine:
+    def test_by_dn(self):
+        ucm = StubAxl(DNS)
+        ucm.remove_phone_line("SEP1", dn=("2000", "PT"))
+        assert ucm.sent == ids("1000", "3000")
+
+    def test_by_index(self):
+        ucm = StubAxl(DNS)
+        ucm.remove_phone_line("SEP1", index=1)
+        assert ucm.sent == ids("2000", "3000")
+
+    def test_by_index_out_of_order(self):
+        ucm = StubAxl(DNS)
+        ucm.lines.reverse()
+        ucm.remove_phone_line("SEP1", index=3)
+        assert ucm.sent == ids("1000", "2000")
+
+    def test_no_cascade_keeps_indexes(self):
+        ucm = StubAxl(DNS)
+        ucm.remove_phone_line("SEP1", index=2, cascade=False)
+        assert ucm.sent == {
+            "line": [
+                {"index": 1, "dirn": {"pattern": "1000", "routePartitionName": "PT"}},
+                {"index": 3, "dirn": {"pattern": "3000", "routePartitionName": "PT"}},
+            ]
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"index": 0},
+            {"index": -1},
+            {"index": 4},
+            {"dn": ("1000", "PT"), "index": 1},
+            {"dn": ("9000", "PT")},
+        ],
+    )
+    def test_invalid(self, kwargs):
+        ucm = StubAxl(DNS)
+        with pytest.raises(InvalidArguments):
+            ucm.remove_phone_line("SEP1", **kwargs)
+        assert ucm.client.updates == []
+
+    def test_only_line(self):
+        ucm = StubAxl(DNS[:1])
+        with pytest.raises(InvalidArguments):
+            ucm.remove_phone_line("SEP1", index=1)
+        assert ucm.client.updates == []